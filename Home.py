@@ -6,34 +6,149 @@ Fixed: Replaced st.switch_page() with st.page_link()
 
 import streamlit as st
 import sys
+import time
+import importlib
+import threading
 from pathlib import Path
 
 # Add utils to path
 sys.path.append(str(Path(__file__).parent))
 
-from utils.api_client import get_api_client
-from utils.portfolio_manager import get_portfolio, initialize_portfolio
+from utils.api_client import get_api_client, fetch_concurrently, SESSION_MEMO_PREFIX
+from utils.portfolio_manager import get_portfolio, get_portfolio_key, initialize_portfolio
 from utils.insights_generator import generate_insights
 from utils.loading_skeletons import (
     show_hero_card_skeleton,
     show_risk_score_skeleton,
-    show_insight_card_skeleton,
-    show_loading_message
+    show_insight_card_skeleton
 )
 from utils.portfolio_value import (
     get_portfolio_stats,
     initialize_portfolio_investment,
-    format_currency,
-    format_percent
+    format_currency
 )
+from utils.styles import inject_css
+from utils.risk_math import health_band
 from utils.refresh_button import show_refresh_button, show_last_update_time, update_refresh_time
 from utils.tooltips import (
-    show_metric_with_tooltip,
     show_learn_more_section,
     show_contextual_tip,
     tooltip_icon
 )
 
+# Session memo of the risk/health/insights-HTML bundle; matches the API cache TTL
+RISK_MEMO_KEY = f"{SESSION_MEMO_PREFIX}home_risk"
+RISK_MEMO_TTL = 300
+
+# Aggressive per-request timeout for the backend so Home never blocks startup
+HOME_API_TIMEOUT = 5
+
+# (color, emoji, tip scenario) per health band, indexed by utils.risk_math.health_band
+RISK_SCORE_STYLES = (
+    ("#dc3545", "🔴", "high_risk"),
+    ("#ffc107", "⚠️", "low_sharpe"),
+    ("#28a745", "✅", "good_portfolio"),
+)
+
+# HTML templates (built once at import; only the substitution runs per rerun)
+HERO_CARD_TMPL = """
+<div class="hero-card">
+    <div style="font-size: 0.875rem; opacity: 0.9; margin-bottom: 0.5rem;">
+        Portfolio Value
+    </div>
+    <div style="font-size: 2.5rem; font-weight: bold; margin-bottom: 0.5rem;">
+        {total_value_formatted}
+    </div>
+    <div style="font-size: 1rem; opacity: 0.9;">
+        {gain_loss_pct_formatted} • {gain_loss_formatted}
+    </div>
+    <div style="margin-top: 1rem; padding-top: 1rem; border-top: 1px solid rgba(255,255,255,0.2);">
+        <div style="font-size: 0.875rem; opacity: 0.9;">
+            {holdings_count} Holdings
+        </div>
+    </div>
+</div>
+"""
+
+RISK_CARD_TMPL = """
+<div class="metric-card">
+    <div style="text-align: center;">
+        <div style="font-size: 3rem; margin-bottom: 0.5rem;">{emoji}</div>
+        <div style="font-size: 2.5rem; font-weight: bold; color: {color}; margin-bottom: 0.5rem;">
+            {score}
+        </div>
+        <div style="font-size: 1rem; color: #666; text-transform: capitalize;">
+            Risk Score: {status}
+        </div>
+    </div>
+</div>
+"""
+
+INSIGHT_CARD_TMPL = """
+<div class="insight-card">
+    <div style="font-weight: 600; color: #1f77b4; margin-bottom: 0.5rem;">
+        {emoji} {title}
+    </div>
+    <div style="color: #666; font-size: 0.9rem;">
+        {description}
+    </div>
+</div>
+"""
+
+HOLDING_ROW_TMPL = (
+    '<div class="holding-row">'
+    '<span class="holding-symbol">{symbol}</span>'
+    '<span class="holding-weight">{weight:.1f}%</span>'
+    '<span class="holding-value">{value}</span>'
+    '</div>'
+)
+
+def render_insights_html(insights) -> str:
+    """Render the top 3 insight cards as one HTML string ("" when there are none)"""
+    return "".join(
+        INSIGHT_CARD_TMPL.format(
+            emoji=insight.get('emoji', '💡'),
+            title=insight.get('title', 'Insight'),
+            description=insight.get('description', '')
+        )
+        for insight in (insights or [])[:3]
+    )
+
+# Heavy modules the other pages import; page scripts themselves are exec'd by
+# Streamlit (not importable), so we warm their dependencies instead
+PREWARM_MODULES = (
+    "plotly.graph_objects",
+    "plotly.subplots",
+    "yfinance",
+    "utils.performance_chart",
+    "utils.scenario_modal",
+    "utils.hedge_preview",
+)
+
+def _import_modules(module_names):
+    """Import modules so later page loads hit sys.modules"""
+    for name in module_names:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            # Best effort only; the page reports the real error when it imports
+            pass
+
+@st.cache_resource(show_spinner=False)
+def _prewarm_page_imports() -> bool:
+    """Start a one-off background import of page dependencies (once per process)"""
+    threading.Thread(
+        target=_import_modules,
+        args=(PREWARM_MODULES,),
+        name="prewarm-imports",
+        daemon=True
+    ).start()
+    return True
+
+def _set_risk_help(visible: bool):
+    """Button callback: show or hide the risk score help panel"""
+    st.session_state['show_risk_score_help'] = visible
+
 # Initialize
 initialize_portfolio()
 initialize_portfolio_investment(default_amount=100000.0)  # $100K default
@@ -46,58 +161,11 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# Hide default Streamlit elements
-st.markdown("""
-<style>
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {visibility: hidden;}
-    
-    .main-header {
-        font-size: 1.75rem;
-        font-weight: bold;
-        margin-bottom: 0.5rem;
-    }
-    
-    .hero-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        border-radius: 1rem;
-        padding: 2rem;
-        color: white;
-        margin: 1rem 0;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-    }
-    
-    .metric-card {
-        background: #f8f9fa;
-        border-radius: 1rem;
-        padding: 1.5rem;
-        margin: 0.75rem 0;
-    }
-    
-    .insight-card {
-        background: white;
-        border: 1px solid #e0e2e6;
-        border-radius: 0.75rem;
-        padding: 1.25rem;
-        margin: 0.75rem 0;
-        box-shadow: 0 1px 3px rgba(0, 0, 0, 0.05);
-    }
-    
-    .action-button {
-        background: #1f77b4;
-        color: white;
-        border: none;
-        padding: 0.75rem 1.5rem;
-        border-radius: 0.5rem;
-        font-weight: 500;
-        cursor: pointer;
-        width: 100%;
-        text-align: center;
-        margin: 0.5rem 0;
-    }
-</style>
-""", unsafe_allow_html=True)
+# Warm up Portfolio/Risk page imports while the user reads Home
+_prewarm_page_imports()
+
+# Hide default Streamlit elements (stylesheet is read from disk once per process)
+inject_css("home.css")
 
 # Sidebar with refresh button
 with st.sidebar:
@@ -162,51 +230,74 @@ if not symbols:
 content_container = st.container()
 
 with content_container:
-    # Show loading skeletons first
+    # Hashable tuples for caching (built once per portfolio change)
+    symbols_tuple, weights_tuple = get_portfolio_key()
+    
+    # Reruns that don't change the portfolio (button clicks, expanders)
+    # reuse this session's last result without hashing cache keys again
+    memo = st.session_state.get(RISK_MEMO_KEY)
+    memo_key = (symbols_tuple, weights_tuple)
+    memo_fresh = (
+        memo is not None
+        and memo['key'] == memo_key
+        and time.time() - memo['ts'] < RISK_MEMO_TTL
+    )
+    
     hero_placeholder = st.empty()
     risk_score_placeholder = st.empty()
     insights_placeholder = st.empty()
     
-    # Show skeletons
-    with hero_placeholder.container():
-        show_hero_card_skeleton()
-    
-    with risk_score_placeholder.container():
-        show_risk_score_skeleton()
-    
-    with insights_placeholder.container():
-        show_insight_card_skeleton(count=3)
+    # Show loading skeletons only when there is actually something to wait for
+    if not memo_fresh:
+        with hero_placeholder.container():
+            show_hero_card_skeleton()
+        
+        with risk_score_placeholder.container():
+            show_risk_score_skeleton()
+        
+        with insights_placeholder.container():
+            show_insight_card_skeleton(count=3)
     
     # Fetch data (cached for 5 minutes)
     try:
-        # Convert to tuples for caching
-        symbols_tuple = tuple(symbols)
-        weights_tuple = tuple(weights)
-        
-        # Set aggressive timeout for cloud environment
-        import socket
-        socket.setdefaulttimeout(5)  # Only 5 seconds!
-        
         client = get_api_client()
         
         # Try to get data, but don't let it block startup
         try:
-            # Get portfolio stats (includes real value calculation)
-            portfolio_stats = get_portfolio_stats(symbols, weights)
-            
-            # Get health score (cached)
-            health_data = client.get_portfolio_health(symbols_tuple, weights_tuple)
-            
-            # Get risk analysis (cached)
-            risk_data = client.get_risk_analysis(symbols_tuple, weights_tuple, period="1year")
-            
-            # Generate insights (cached) - pass tuples for caching
-            insights = generate_insights(symbols_tuple, weights_tuple, risk_data)
+            if memo_fresh:
+                # Get portfolio stats (includes real value calculation)
+                portfolio_stats = get_portfolio_stats(symbols, weights)
+                risk_data, health_data, insights_html = memo['val']
+            else:
+                # Prices (FMP) and risk analysis (backend) are independent, so fetch
+                # them in parallel. Risk is cached on the symbols/weights tuples only
+                # so the entry is shared with the Portfolio and Risk pages.
+                portfolio_stats, risk_data = fetch_concurrently(
+                    lambda: get_portfolio_stats(symbols, weights),
+                    lambda: client.get_risk_analysis(symbols_tuple, weights_tuple, _timeout=HOME_API_TIMEOUT)
+                )
+                
+                # Get health score (cached, derived from the risk analysis above)
+                health_data = client.get_portfolio_health(symbols_tuple, weights_tuple, _timeout=HOME_API_TIMEOUT)
+                
+                # Generate insights (cached) - pass tuples for caching
+                insights = generate_insights(symbols_tuple, weights_tuple, risk_data)
+                
+                # Rendered once per fetch; memo hits reuse the finished HTML
+                insights_html = render_insights_html(insights)
+                
+                # Only memoize successful fetches so errors are retried next run
+                if 'error' not in risk_data:
+                    st.session_state[RISK_MEMO_KEY] = {
+                        'key': memo_key,
+                        'val': (risk_data, health_data, insights_html),
+                        'ts': time.time()
+                    }
             
             # Update refresh time
             update_refresh_time()
             
-        except (socket.timeout, Exception) as api_error:
+        except Exception as api_error:
             # API failed - show placeholder data
             st.warning("⚠️ Unable to connect to market data API. Showing portfolio structure only.")
             
@@ -216,39 +307,22 @@ with content_container:
                 'gain_loss_pct_formatted': '+0.00%',
                 'gain_loss_formatted': '$0.00',
                 'holdings_count': len(symbols),
-                'holdings': [{'symbol': s, 'weight': w, 'current_value': 100000*w} 
+                'holdings': [{'symbol': s, 'weight': w, 'current_value': 100000*w,
+                              'current_value_formatted': format_currency(100000*w)} 
                             for s, w in zip(symbols, weights)]
             }
             health_data = {'score': 50, 'status': 'Unknown'}
             risk_data = {}
-            insights = []
-        
-        finally:
-            # Always restore timeout
-            socket.setdefaulttimeout(None)
+            insights_html = ""
         
         # Replace skeletons with real data
         
         # 1. Hero Card - Real Portfolio Value
         with hero_placeholder.container():
-            st.markdown(f"""
-            <div class="hero-card">
-                <div style="font-size: 0.875rem; opacity: 0.9; margin-bottom: 0.5rem;">
-                    Portfolio Value
-                </div>
-                <div style="font-size: 2.5rem; font-weight: bold; margin-bottom: 0.5rem;">
-                    {portfolio_stats['total_value_formatted']}
-                </div>
-                <div style="font-size: 1rem; opacity: 0.9;">
-                    {portfolio_stats['gain_loss_pct_formatted']} • {portfolio_stats['gain_loss_formatted']}
-                </div>
-                <div style="margin-top: 1rem; padding-top: 1rem; border-top: 1px solid rgba(255,255,255,0.2);">
-                    <div style="font-size: 0.875rem; opacity: 0.9;">
-                        {portfolio_stats['holdings_count']} Holdings
-                    </div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(
+                HERO_CARD_TMPL.format_map(portfolio_stats),
+                unsafe_allow_html=True
+            )
             
             # Add tooltip explanation
             with st.expander("ℹ️ What is Portfolio Value?", expanded=False):
@@ -260,67 +334,37 @@ with content_container:
             status = health_data.get('status', 'Unknown')
             
             # Color based on score
-            if score >= 80:
-                color = "#28a745"
-                emoji = "✅"
-                scenario = "good_portfolio"
-            elif score >= 60:
-                color = "#ffc107"
-                emoji = "⚠️"
-                scenario = "low_sharpe"
-            else:
-                color = "#dc3545"
-                emoji = "🔴"
-                scenario = "high_risk"
-            
-            col1, col2 = st.columns([2, 1])
+            color, emoji, scenario = RISK_SCORE_STYLES[health_band(score)]
             
-            with col1:
-                st.markdown(f"""
-                <div class="metric-card">
-                    <div style="text-align: center;">
-                        <div style="font-size: 3rem; margin-bottom: 0.5rem;">{emoji}</div>
-                        <div style="font-size: 2.5rem; font-weight: bold; color: {color}; margin-bottom: 0.5rem;">
-                            {score}
-                        </div>
-                        <div style="font-size: 1rem; color: #666; text-transform: capitalize;">
-                            Risk Score: {status}
-                        </div>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+            # Single full-width card; no column layout or spacer element needed
+            st.markdown(
+                RISK_CARD_TMPL.format(emoji=emoji, color=color, score=score, status=status),
+                unsafe_allow_html=True
+            )
             
-            with col2:
-                st.markdown("<div style='height: 40px;'></div>", unsafe_allow_html=True)
-                # Learn More button
-                if st.button("ℹ️ Learn", key="risk_score_learn", use_container_width=True):
-                    st.session_state['show_risk_score_help'] = True
+            # Learn More button (callbacks update state before the rerun, so no
+            # second st.rerun() pass is needed to hide the panel again)
+            st.button(
+                "ℹ️ Learn",
+                key="risk_score_learn",
+                use_container_width=True,
+                on_click=_set_risk_help,
+                args=(True,)
+            )
             
             # Show contextual help
             if st.session_state.get('show_risk_score_help', False):
                 show_learn_more_section("risk_score", expanded=True)
                 show_contextual_tip(scenario)
-                if st.button("Close", key="close_risk_help"):
-                    st.session_state['show_risk_score_help'] = False
-                    st.rerun()
+                st.button("Close", key="close_risk_help", on_click=_set_risk_help, args=(False,))
         
         # 3. Key Insights
         with insights_placeholder.container():
-            st.markdown("### 💡 Key Insights")
-            
-            if insights and len(insights) > 0:
-                for insight in insights[:3]:  # Top 3 insights
-                    st.markdown(f"""
-                    <div class="insight-card">
-                        <div style="font-weight: 600; color: #1f77b4; margin-bottom: 0.5rem;">
-                            {insight.get('emoji', '💡')} {insight.get('title', 'Insight')}
-                        </div>
-                        <div style="color: #666; font-size: 0.9rem;">
-                            {insight.get('description', '')}
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
+            if insights_html:
+                # Header and top 3 insight cards go out as one markdown element
+                st.markdown("### 💡 Key Insights\n" + insights_html, unsafe_allow_html=True)
             else:
+                st.markdown("### 💡 Key Insights")
                 st.info("No insights available yet. Check back after market analysis.")
         
         # Quick Actions - FIXED: Using st.page_link instead of st.switch_page
@@ -339,19 +383,18 @@ with content_container:
         
         # Holdings Summary
         with st.expander("📋 Holdings Details", expanded=False):
-            for holding in portfolio_stats['holdings']:
-                col1, col2, col3 = st.columns([2, 1, 1])
-                
-                with col1:
-                    st.write(f"**{holding['symbol']}**")
-                
-                with col2:
-                    st.write(f"{holding['weight']*100:.1f}%")
-                
-                with col3:
-                    st.write(format_currency(holding['current_value']))
+            # One markdown element for all rows instead of 3 columns + 3 writes per holding
+            holdings_html = "".join(
+                HOLDING_ROW_TMPL.format(
+                    symbol=holding['symbol'],
+                    weight=holding['weight'] * 100,
+                    value=holding['current_value_formatted']
+                )
+                for holding in portfolio_stats['holdings']
+            )
+            # Divider rides along in the same element as the rows
+            st.markdown(holdings_html + "\n\n---", unsafe_allow_html=True)
             
-            st.markdown("---")
             # FIXED: Using st.page_link
             st.page_link("pages/2_Portfolio.py", label="✏️ Edit Portfolio", use_container_width=True)
         
@@ -370,6 +413,9 @@ with content_container:
 
 # Footer
 st.markdown("---")
-st.caption("💡 **Tip**: Use the refresh button in the sidebar to update with the latest market data.")
-st.caption("📊 Data is cached for 5 minutes for faster performance.")
-st.caption("❓ Tap any ℹ️ icon to learn about metrics.")
\ No newline at end of file
+# One caption element with hard line breaks instead of three separate elements
+st.caption(
+    "💡 **Tip**: Use the refresh button in the sidebar to update with the latest market data.  \n"
+    "📊 Data is cached for 5 minutes for faster performance.  \n"
+    "❓ Tap any ℹ️ icon to learn about metrics."
+)
\ No newline at end of file
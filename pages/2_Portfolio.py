@@ -5,13 +5,12 @@ Add, remove, and adjust portfolio allocations with real-time feedback
 """
 
 import streamlit as st
-import plotly.graph_objects as go
-import time
 
 # Lazy imports - load these inside functions after Streamlit is ready
 def get_utils():
     from utils.portfolio_manager import (
         get_portfolio, 
+        get_portfolio_key,
         set_portfolio, 
         add_to_portfolio, 
         remove_from_portfolio,
@@ -20,7 +19,6 @@ def get_utils():
     )
     from utils.portfolio_value import (
         get_portfolio_stats,
-        format_currency,
         format_percent,
         initialize_portfolio_investment
     )
@@ -28,17 +26,17 @@ def get_utils():
     from utils.refresh_button import show_refresh_button, show_last_update_time
     from utils.tooltips import show_metric_with_tooltip, tooltip_icon
     from utils.loading_skeletons import show_chart_skeleton, show_metric_skeleton
-    from utils.performance_chart import show_performance_section
+    from utils.styles import inject_css
     
     return {
         'get_portfolio': get_portfolio,
+        'get_portfolio_key': get_portfolio_key,
         'set_portfolio': set_portfolio,
         'add_to_portfolio': add_to_portfolio,
         'remove_from_portfolio': remove_from_portfolio,
         'update_weight': update_weight,
         'initialize_portfolio': initialize_portfolio,
         'get_portfolio_stats': get_portfolio_stats,
-        'format_currency': format_currency,
         'format_percent': format_percent,
         'initialize_portfolio_investment': initialize_portfolio_investment,
         'get_api_client': get_api_client,
@@ -48,9 +46,160 @@ def get_utils():
         'tooltip_icon': tooltip_icon,
         'show_chart_skeleton': show_chart_skeleton,
         'show_metric_skeleton': show_metric_skeleton,
-        'show_performance_section': show_performance_section
+        'inject_css': inject_css
     }
 
+# Static/templated HTML (built once at import; only substitution runs per rerun)
+STATS_CARD_TMPL = """
+<div class="stats-card">
+    <div class="stat-label">Total Portfolio Value</div>
+    <div class="stat-value">{total_value_formatted}</div>
+    <div style="font-size: 0.875rem; opacity: 0.9;">
+        {gain_loss_pct_formatted} • {gain_loss_formatted} • {holdings_count} Holdings
+    </div>
+</div>
+"""
+
+STATS_CARD_LOADING_HTML = """
+<div class="stats-card">
+    <div class="stat-label">Total Portfolio Value</div>
+    <div class="stat-value">Loading...</div>
+</div>
+"""
+
+PERFORMANCE_TIP_HTML = """
+<div style="background: #f0f9ff; border-radius: 12px; padding: 1rem; margin-bottom: 1rem; border-left: 4px solid #3b82f6;">
+    <strong>💡 Tip:</strong> Historical performance shows how your portfolio would have performed 
+    over different time periods compared to the S&P 500 benchmark. Use the time period buttons 
+    to see 1 month, 3 months, 6 months, 1 year, or year-to-date performance.
+</div>
+"""
+
+HOLDING_LABEL_TMPL = """
+<div style="padding-top: 0.5rem;">
+    <div class="holding-symbol">{symbol}</div>
+    <div class="holding-details">{value}</div>
+</div>
+"""
+
+# Quick-add choices by category
+POPULAR_HOLDINGS = {
+    "Tech": [
+        {"symbol": "AAPL", "name": "Apple"},
+        {"symbol": "MSFT", "name": "Microsoft"},
+        {"symbol": "GOOGL", "name": "Google"},
+        {"symbol": "NVDA", "name": "NVIDIA"}
+    ],
+    "Index ETFs": [
+        {"symbol": "SPY", "name": "S&P 500"},
+        {"symbol": "QQQ", "name": "Nasdaq 100"},
+        {"symbol": "VTI", "name": "Total Market"},
+        {"symbol": "IWM", "name": "Russell 2000"}
+    ],
+    "Bonds": [
+        {"symbol": "TLT", "name": "20+ Year Treasury"},
+        {"symbol": "BND", "name": "Total Bond"},
+        {"symbol": "AGG", "name": "Aggregate Bonds"},
+        {"symbol": "LQD", "name": "Investment Grade"}
+    ],
+    "Commodities": [
+        {"symbol": "GLD", "name": "Gold"},
+        {"symbol": "SLV", "name": "Silver"},
+        {"symbol": "USO", "name": "Oil"},
+        {"symbol": "DBA", "name": "Agriculture"}
+    ]
+}
+
+# Preset portfolios offered in "Load Preset Portfolios"
+PRESETS = {
+    "Aggressive Growth": {
+        "symbols": ["QQQ", "ARKK", "NVDA", "TSLA"],
+        "weights": [0.40, 0.30, 0.20, 0.10],
+        "description": "High growth tech focus, high volatility"
+    },
+    "Balanced 60/40": {
+        "symbols": ["SPY", "BND", "GLD"],
+        "weights": [0.60, 0.30, 0.10],
+        "description": "Classic balanced portfolio with gold hedge"
+    },
+    "Income Focus": {
+        "symbols": ["VYM", "SCHD", "TLT", "LQD"],
+        "weights": [0.30, 0.30, 0.20, 0.20],
+        "description": "Dividend stocks and bonds for income"
+    },
+    "All-Weather": {
+        "symbols": ["SPY", "TLT", "GLD", "DBC"],
+        "weights": [0.30, 0.40, 0.15, 0.15],
+        "description": "Ray Dalio inspired diversified portfolio"
+    },
+    "Conservative": {
+        "symbols": ["BND", "AGG", "VYM", "USMV"],
+        "weights": [0.40, 0.30, 0.20, 0.10],
+        "description": "Low volatility, capital preservation focus"
+    }
+}
+
+# Table rows for the preset picker (built once, not per rerun)
+PRESET_ROWS = [
+    {
+        "Portfolio": preset_name,
+        "Description": preset_data["description"],
+        "Symbols": ", ".join(preset_data["symbols"])
+    }
+    for preset_name, preset_data in PRESETS.items()
+]
+
+STATIC_CHART_CONFIG = {'staticPlot': True, 'displayModeBar': False}
+
+ALLOCATION_COLORS = ['#667eea', '#764ba2', '#f59e0b', '#10b981', '#ef4444', '#8b5cf6', '#ec4899', '#06b6d4']
+
+# Only ask /analyze for insights once the portfolio is a finished, diversified mix
+MIN_INSIGHT_HOLDINGS = 2
+WEIGHT_SUM_TOLERANCE = 0.05
+
+# Holding weight slider increment
+WEIGHT_STEP = 0.01
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def build_allocation_chart(symbols_tuple: tuple, weights_tuple: tuple):
+    """
+    Build the allocation donut chart (cached on the symbols/weights tuples)
+    
+    Held as a shared resource rather than cache_data so a hit hands back the
+    figure directly instead of unpickling a copy; it's never mutated after build.
+    """
+    # Imported here so an empty portfolio never pays plotly's import cost
+    import plotly.graph_objects as go
+    
+    fig = go.Figure(data=[go.Pie(
+        labels=list(symbols_tuple),
+        values=list(weights_tuple),
+        hole=0.5,
+        textposition='auto',
+        textinfo='label+percent',
+        marker=dict(
+            colors=ALLOCATION_COLORS,
+            line=dict(color='white', width=2)
+        )
+    )])
+    
+    fig.update_layout(
+        showlegend=True,
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=-0.2,
+            xanchor="center",
+            x=0.5
+        ),
+        height=400,
+        margin=dict(t=20, b=20, l=20, r=20),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+    )
+    
+    return fig
+
 st.set_page_config(
     page_title="Portfolio Editor",
     page_icon="💼",
@@ -61,96 +210,105 @@ st.set_page_config(
 # Initialize
 utils = get_utils()
 initialize_portfolio = utils['initialize_portfolio']
+inject_css = utils['inject_css']
+get_portfolio = utils['get_portfolio']
+get_portfolio_key = utils['get_portfolio_key']
+set_portfolio = utils['set_portfolio']
+add_to_portfolio = utils['add_to_portfolio']
+remove_from_portfolio = utils['remove_from_portfolio']
+update_weight = utils['update_weight']
+get_portfolio_stats = utils['get_portfolio_stats']
+get_api_client = utils['get_api_client']
+show_refresh_button = utils['show_refresh_button']
+show_last_update_time = utils['show_last_update_time']
+show_metric_with_tooltip = utils['show_metric_with_tooltip']
+tooltip_icon = utils['tooltip_icon']
+show_chart_skeleton = utils['show_chart_skeleton']
 initialize_portfolio()
 
-# Custom CSS
-st.markdown("""
-<style>
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {visibility: hidden;}
-    
-    .portfolio-header {
-        font-size: 1.75rem;
-        font-weight: bold;
-        margin-bottom: 1rem;
-        color: #111827;
-    }
+def on_weight_change(symbol: str, slider_key: str):
+    """Slider callback: apply the new weight before the page reruns"""
+    new_weight = st.session_state[slider_key]
     
-    .stats-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 1.5rem;
-        border-radius: 16px;
-        margin-bottom: 1rem;
-        box-shadow: 0 4px 12px rgba(102, 126, 234, 0.3);
-    }
+    # Compare with the weight stored now, not one captured at render time:
+    # another slider may have renormalized this holding since it was drawn
+    symbols, weights = get_portfolio()
+    if symbol not in symbols:
+        return
+    current_weight = weights[symbols.index(symbol)]
     
-    .stat-label {
-        font-size: 0.875rem;
-        opacity: 0.9;
-        margin-bottom: 0.25rem;
-    }
+    # Stored weights are renormalized floats; a slider value within half a step
+    # of the stored one is the same allocation, so don't rewrite the portfolio
+    if abs(new_weight - current_weight) < WEIGHT_STEP / 2:
+        return
     
-    .stat-value {
-        font-size: 2rem;
-        font-weight: bold;
-        margin-bottom: 0.5rem;
-    }
+    update_weight(symbol, new_weight)
+
+def on_load_preset():
+    """Load button callback: replace the portfolio with the selected preset"""
+    preset_name = st.session_state.preset_choice
+    preset_data = PRESETS[preset_name]
     
-    .holding-card {
-        background: white;
-        border: 1px solid #e5e7eb;
-        border-radius: 12px;
-        padding: 1rem;
-        margin: 0.5rem 0;
-        box-shadow: 0 1px 3px rgba(0,0,0,0.05);
-    }
+    # Copy: portfolio edits mutate the stored lists in place
+    set_portfolio(list(preset_data['symbols']), list(preset_data['weights']))
+    st.toast(f"✓ Loaded {preset_name}")
+
+@st.fragment
+def holdings_editor():
+    """
+    Per-holding label, weight slider, and remove button
     
-    .holding-symbol {
-        font-weight: 600;
-        color: #111827;
-        font-size: 1.125rem;
-    }
+    Runs as a fragment so dragging a slider only reruns this block instead of
+    the stats card, allocation chart, and insights request; removing a holding
+    still triggers a full-app rerun.
+    """
+    # Read the portfolio here, not from arguments: a fragment rerun reuses the
+    # arguments of the last full run, which predate any slider renormalization
+    symbols, weights = get_portfolio()
+    stats = get_portfolio_stats(symbols, weights)
     
-    .holding-details {
-        font-size: 0.875rem;
-        color: #6b7280;
-        margin-top: 0.25rem;
-    }
+    # Look values up by symbol rather than assuming stats rows follow portfolio order
+    values_by_symbol = {h['symbol']: h['current_value_formatted'] for h in stats['holdings']}
     
-    .section-header {
-        font-size: 1.125rem;
-        font-weight: 600;
-        color: #111827;
-        margin: 1.5rem 0 0.75rem 0;
-    }
+    for i, (symbol, weight) in enumerate(zip(symbols, weights)):
+        col1, col2, col3 = st.columns([2, 3, 1])
     
-    .add-holding-card {
-        background: #f9fafb;
-        border: 2px dashed #d1d5db;
-        border-radius: 12px;
-        padding: 1.5rem;
-        text-align: center;
-        margin: 1rem 0;
-    }
+        with col1:
+            st.markdown(
+                HOLDING_LABEL_TMPL.format(
+                    symbol=symbol,
+                    value=values_by_symbol[symbol]
+                ),
+                unsafe_allow_html=True
+            )
     
-    .quick-action-btn {
-        background: white;
-        border: 2px solid #e5e7eb;
-        border-radius: 12px;
-        padding: 1rem;
-        text-align: center;
-        cursor: pointer;
-        transition: all 0.2s;
-    }
+        with col2:
+            # Weight slider (the callback applies the change before the widget's
+            # own rerun, so there's no second st.rerun() pass per adjustment)
+            slider_key = f"weight_{symbol}_{i}"
+            st.slider(
+                f"Allocation",
+                min_value=0.0,
+                max_value=1.0,
+                value=float(weight),
+                step=WEIGHT_STEP,
+                format="%.1f%%",
+                key=slider_key,
+                label_visibility="collapsed",
+                on_change=on_weight_change,
+                args=(symbol, slider_key)
+            )
     
-    .quick-action-btn:hover {
-        border-color: #667eea;
-        background: #f9fafb;
-    }
-</style>
-""", unsafe_allow_html=True)
+        with col3:
+            if st.button("🗑️", key=f"remove_{symbol}_{i}", help=f"Remove {symbol}"):
+                remove_from_portfolio(symbol)
+                st.toast(f"✓ Removed {symbol}")
+                st.rerun()
+    
+        st.markdown("---")
+
+# Custom CSS (stylesheet is read from disk once per process)
+inject_css("portfolio.css")
 
 # Sidebar
 with st.sidebar:
@@ -183,74 +341,33 @@ else:
         try:
             stats = get_portfolio_stats(symbols, weights)
             
-            st.markdown(f"""
-            <div class="stats-card">
-                <div class="stat-label">Total Portfolio Value</div>
-                <div class="stat-value">{stats['total_value_formatted']}</div>
-                <div style="font-size: 0.875rem; opacity: 0.9;">
-                    {stats['gain_loss_pct_formatted']} • {stats['gain_loss_formatted']} • {stats['holdings_count']} Holdings
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(STATS_CARD_TMPL.format_map(stats), unsafe_allow_html=True)
         except Exception as e:
-            st.markdown("""
-            <div class="stats-card">
-                <div class="stat-label">Total Portfolio Value</div>
-                <div class="stat-value">Loading...</div>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(STATS_CARD_LOADING_HTML, unsafe_allow_html=True)
     
-    # Portfolio visualization
-    st.markdown('<div class="section-header">📊 Asset Allocation</div>', unsafe_allow_html=True)
-    
-    viz_placeholder = st.empty()
-    
-    with viz_placeholder.container():
+    # Portfolio visualization (collapsed by default; slider/add/remove reruns
+    # don't need the chart on screen, so the browser only draws it on demand)
+    with st.expander("📊 Asset Allocation", expanded=False):
         try:
-            # Create donut chart
-            fig = go.Figure(data=[go.Pie(
-                labels=symbols,
-                values=weights,
-                hole=0.5,
-                textposition='auto',
-                textinfo='label+percent',
-                marker=dict(
-                    colors=['#667eea', '#764ba2', '#f59e0b', '#10b981', '#ef4444', '#8b5cf6', '#ec4899', '#06b6d4'],
-                    line=dict(color='white', width=2)
-                ),
-                hovertemplate='<b>%{label}</b><br>Allocation: %{percent}<br>Weight: %{value:.2%}<extra></extra>'
-            )])
-            
-            fig.update_layout(
-                showlegend=True,
-                legend=dict(
-                    orientation="h",
-                    yanchor="bottom",
-                    y=-0.2,
-                    xanchor="center",
-                    x=0.5
-                ),
-                height=400,
-                margin=dict(t=20, b=20, l=20, r=20),
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(0,0,0,0)',
-            )
+            # Create donut chart (cached per allocation)
+            fig = build_allocation_chart(*get_portfolio_key())
             
-            st.plotly_chart(fig, use_container_width=True)
+            # Static render: labels/percents are on the slices, so skip hover and
+            # interaction handlers (and the mode bar) entirely
+            st.plotly_chart(fig, use_container_width=True, config=STATIC_CHART_CONFIG)
         except Exception as e:
             show_chart_skeleton(height=400)
 
     if symbols and weights:
         with st.expander("📈 Historical Performance", expanded=False):
-            st.markdown("""
-            <div style="background: #f0f9ff; border-radius: 12px; padding: 1rem; margin-bottom: 1rem; border-left: 4px solid #3b82f6;">
-                <strong>💡 Tip:</strong> Historical performance shows how your portfolio would have performed 
-                over different time periods compared to the S&P 500 benchmark. Use the time period buttons 
-                to see 1 month, 3 months, 6 months, 1 year, or year-to-date performance.
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(PERFORMANCE_TIP_HTML, unsafe_allow_html=True)
             
-            show_performance_section(symbols, weights)
+            # Expander bodies run on every rerun even while collapsed, so the
+            # price-history download and chart only happen once the user opts in
+            if st.toggle("Load performance chart", key="load_performance_chart"):
+                # Deferred: pulls in plotly + yfinance only when there's a portfolio to chart
+                from utils.performance_chart import show_performance_section
+                show_performance_section(symbols, weights)
 
         
 
@@ -267,8 +384,7 @@ if symbols:
         if st.button("⚖️ Rebalance to Equal Weight", use_container_width=True):
             equal_weights = [1.0 / len(symbols)] * len(symbols)
             set_portfolio(symbols, equal_weights)
-            st.success("✓ Rebalanced to equal weights")
-            time.sleep(0.5)
+            st.toast("✓ Rebalanced to equal weights")
             st.rerun()
     
     with col2:
@@ -279,50 +395,13 @@ if symbols:
             else:
                 set_portfolio([], [])
                 del st.session_state.confirm_clear
-                st.success("✓ Portfolio cleared")
-                time.sleep(0.5)
+                st.toast("✓ Portfolio cleared")
                 st.rerun()
     
     st.markdown("---")
     
     # Editable holdings
-    for i, (symbol, weight) in enumerate(zip(symbols, weights)):
-        col1, col2, col3 = st.columns([2, 3, 1])
-        
-        with col1:
-            st.markdown(f"""
-            <div style="padding-top: 0.5rem;">
-                <div class="holding-symbol">{symbol}</div>
-                <div class="holding-details">{format_currency(stats['holdings'][i]['current_value'])}</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            # Weight slider
-            new_weight = st.slider(
-                f"Allocation",
-                min_value=0.0,
-                max_value=1.0,
-                value=float(weight),
-                step=0.01,
-                format="%.1f%%",
-                key=f"weight_{symbol}_{i}",
-                label_visibility="collapsed"
-            )
-            
-            # Update weight if changed
-            if abs(new_weight - weight) > 0.001:
-                update_weight(symbol, new_weight)
-                st.rerun()
-        
-        with col3:
-            if st.button("🗑️", key=f"remove_{symbol}_{i}", help=f"Remove {symbol}"):
-                remove_from_portfolio(symbol)
-                st.success(f"✓ Removed {symbol}")
-                time.sleep(0.5)
-                st.rerun()
-        
-        st.markdown("---")
+    holdings_editor()
 
 # Add new holding section
 st.markdown('<div class="section-header">➕ Add New Holding</div>', unsafe_allow_html=True)
@@ -356,8 +435,7 @@ with st.expander("Add Stock or ETF", expanded=len(symbols) == 0):
                     st.error(f"⚠️ {new_symbol} already in portfolio")
                 else:
                     add_to_portfolio(new_symbol, new_allocation / 100)
-                    st.success(f"✓ Added {new_symbol}")
-                    time.sleep(0.5)
+                    st.toast(f"✓ Added {new_symbol}")
                     st.rerun()
             else:
                 st.error("⚠️ Enter a symbol")
@@ -365,37 +443,10 @@ with st.expander("Add Stock or ETF", expanded=len(symbols) == 0):
 # Quick add popular holdings
 st.markdown("### 🎯 Quick Add Popular Holdings")
 
-popular_holdings = {
-    "Tech": [
-        {"symbol": "AAPL", "name": "Apple"},
-        {"symbol": "MSFT", "name": "Microsoft"},
-        {"symbol": "GOOGL", "name": "Google"},
-        {"symbol": "NVDA", "name": "NVIDIA"}
-    ],
-    "Index ETFs": [
-        {"symbol": "SPY", "name": "S&P 500"},
-        {"symbol": "QQQ", "name": "Nasdaq 100"},
-        {"symbol": "VTI", "name": "Total Market"},
-        {"symbol": "IWM", "name": "Russell 2000"}
-    ],
-    "Bonds": [
-        {"symbol": "TLT", "name": "20+ Year Treasury"},
-        {"symbol": "BND", "name": "Total Bond"},
-        {"symbol": "AGG", "name": "Aggregate Bonds"},
-        {"symbol": "LQD", "name": "Investment Grade"}
-    ],
-    "Commodities": [
-        {"symbol": "GLD", "name": "Gold"},
-        {"symbol": "SLV", "name": "Silver"},
-        {"symbol": "USO", "name": "Oil"},
-        {"symbol": "DBA", "name": "Agriculture"}
-    ]
-}
-
-category = st.selectbox("Category", list(popular_holdings.keys()), label_visibility="collapsed")
+category = st.selectbox("Category", list(POPULAR_HOLDINGS.keys()), label_visibility="collapsed")
 
 cols = st.columns(4)
-for i, holding in enumerate(popular_holdings[category]):
+for i, holding in enumerate(POPULAR_HOLDINGS[category]):
     with cols[i]:
         if st.button(
             f"{holding['symbol']}\n{holding['name']}", 
@@ -404,8 +455,7 @@ for i, holding in enumerate(popular_holdings[category]):
         ):
             if holding['symbol'] not in symbols:
                 add_to_portfolio(holding['symbol'], 0.10)  # 10% allocation
-                st.success(f"✓ Added {holding['symbol']}")
-                time.sleep(0.5)
+                st.toast(f"✓ Added {holding['symbol']}")
                 st.rerun()
             else:
                 st.info(f"{holding['symbol']} already in portfolio")
@@ -414,60 +464,44 @@ for i, holding in enumerate(popular_holdings[category]):
 with st.expander("📦 Load Preset Portfolios"):
     st.markdown("**Choose a professionally balanced portfolio:**")
     
-    presets = {
-        "Aggressive Growth": {
-            "symbols": ["QQQ", "ARKK", "NVDA", "TSLA"],
-            "weights": [0.40, 0.30, 0.20, 0.10],
-            "description": "High growth tech focus, high volatility"
-        },
-        "Balanced 60/40": {
-            "symbols": ["SPY", "BND", "GLD"],
-            "weights": [0.60, 0.30, 0.10],
-            "description": "Classic balanced portfolio with gold hedge"
-        },
-        "Income Focus": {
-            "symbols": ["VYM", "SCHD", "TLT", "LQD"],
-            "weights": [0.30, 0.30, 0.20, 0.20],
-            "description": "Dividend stocks and bonds for income"
-        },
-        "All-Weather": {
-            "symbols": ["SPY", "TLT", "GLD", "DBC"],
-            "weights": [0.30, 0.40, 0.15, 0.15],
-            "description": "Ray Dalio inspired diversified portfolio"
-        },
-        "Conservative": {
-            "symbols": ["BND", "AGG", "VYM", "USMV"],
-            "weights": [0.40, 0.30, 0.20, 0.10],
-            "description": "Low volatility, capital preservation focus"
-        }
-    }
+    # One table element for every preset instead of an HTML block + button per row
+    st.dataframe(PRESET_ROWS, hide_index=True, use_container_width=True)
     
-    for preset_name, preset_data in presets.items():
-        col1, col2 = st.columns([4, 1])
-        
-        with col1:
-            st.markdown(f"""
-            **{preset_name}**  
-            <small style="color: #6b7280;">{preset_data['description']}</small>  
-            <small style="color: #9ca3af;">{', '.join(preset_data['symbols'])}</small>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            if st.button("Load", key=f"preset_{preset_name}", use_container_width=True):
-                set_portfolio(preset_data['symbols'], preset_data['weights'])
-                st.success(f"✓ Loaded {preset_name}")
-                time.sleep(0.5)
-                st.rerun()
+    col1, col2 = st.columns([4, 1])
+    
+    with col1:
+        st.selectbox(
+            "Preset",
+            list(PRESETS),
+            key="preset_choice",
+            label_visibility="collapsed"
+        )
+    
+    with col2:
+        st.button("Load", key="load_preset", use_container_width=True, on_click=on_load_preset)
 
 # Portfolio insights (if we have holdings)
-if symbols and len(symbols) > 0:
+if symbols:
     st.markdown("---")
     st.markdown('<div class="section-header">💡 Portfolio Insights</div>', unsafe_allow_html=True)
-    
+
+# Skip the /analyze call while the portfolio is still being built: a single
+# holding or weights that don't sum to ~100% only produce throwaway metrics
+insights_ready = (
+    len(symbols) >= MIN_INSIGHT_HOLDINGS
+    and abs(sum(weights) - 1.0) < WEIGHT_SUM_TOLERANCE
+)
+
+if symbols and not insights_ready:
+    st.info(f"💡 Add at least {MIN_INSIGHT_HOLDINGS} holdings with weights totaling 100% to see portfolio insights")
+
+if insights_ready:
     try:
         client = get_api_client()
-        symbols_tuple = tuple(symbols)
-        weights_tuple = tuple(weights)
+        
+        # Same (symbols, weights) tuples as Home, so this is normally a cache hit
+        # on the entry Home already fetched rather than a new /analyze request
+        symbols_tuple, weights_tuple = get_portfolio_key()
         risk_data = client.get_risk_analysis(symbols_tuple, weights_tuple)
         
         if 'metrics' in risk_data:
@@ -13,17 +13,19 @@ NOW WITH INTERACTIVE SCENARIO CARDS!
 """
 
 import streamlit as st
-import plotly.graph_objects as go
-import numpy as np
+import bisect
+import html
+import math
 import time
 
 # Lazy imports - load these inside functions after Streamlit is ready
 def get_utils():
-    from utils.api_client import get_api_client
-    from utils.portfolio_manager import get_portfolio, set_portfolio
+    from utils.api_client import get_api_client, fetch_concurrently
+    from utils.portfolio_manager import get_portfolio, get_portfolio_key, set_portfolio
+    from utils.risk_math import rank_stress_scenarios
+    from utils.styles import inject_css
     from utils.hedge_preview import show_hedge_preview_dialog, activate_hedge_preview, is_hedge_confirmed
     from utils.tooltips import (
-        show_metric_with_tooltip,
         show_learn_more_section,
         show_contextual_tip,
         tooltip_icon
@@ -37,12 +39,15 @@ def get_utils():
     
     return {
         'get_api_client': get_api_client,
+        'fetch_concurrently': fetch_concurrently,
         'get_portfolio': get_portfolio,
+        'get_portfolio_key': get_portfolio_key,
         'set_portfolio': set_portfolio,
+        'rank_stress_scenarios': rank_stress_scenarios,
+        'inject_css': inject_css,
         'show_hedge_preview_dialog': show_hedge_preview_dialog,
         'activate_hedge_preview': activate_hedge_preview,
         'is_hedge_confirmed': is_hedge_confirmed,
-        'show_metric_with_tooltip': show_metric_with_tooltip,
         'show_learn_more_section': show_learn_more_section,
         'show_contextual_tip': show_contextual_tip,
         'tooltip_icon': tooltip_icon,
@@ -64,12 +69,15 @@ utils = get_utils()
 
 # Unpack all utilities
 get_api_client = utils['get_api_client']
+fetch_concurrently = utils['fetch_concurrently']
 get_portfolio = utils['get_portfolio']
+get_portfolio_key = utils['get_portfolio_key']
 set_portfolio = utils['set_portfolio']
+rank_stress_scenarios = utils['rank_stress_scenarios']
+inject_css = utils['inject_css']
 show_hedge_preview_dialog = utils['show_hedge_preview_dialog']
 activate_hedge_preview = utils['activate_hedge_preview']
 is_hedge_confirmed = utils['is_hedge_confirmed']
-show_metric_with_tooltip = utils['show_metric_with_tooltip']
 show_learn_more_section = utils['show_learn_more_section']
 show_contextual_tip = utils['show_contextual_tip']
 tooltip_icon = utils['tooltip_icon']
@@ -78,279 +86,179 @@ activate_scenario_modal = utils['activate_scenario_modal']
 is_scenario_modal_active = utils['is_scenario_modal_active']
 get_active_scenario = utils['get_active_scenario']
 
-# Rest of your code continues as normal...
-
-# Enhanced iOS-style CSS
-st.markdown("""
-<style>
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {visibility: hidden;}
-    
-    /* Hero Card - Worst Case Scenario */
-    .risk-hero {
-        background: linear-gradient(135deg, #ef4444 0%, #f97316 100%);
-        color: white;
-        padding: 2rem 1.5rem;
-        border-radius: 24px;
-        margin-bottom: 1rem;
-        box-shadow: 0 10px 30px rgba(239, 68, 68, 0.3);
-    }
-    
-    .hero-label {
-        font-size: 0.875rem;
-        opacity: 0.9;
-        margin-bottom: 0.5rem;
-    }
-    
-    .hero-value {
-        font-size: 3.5rem;
-        font-weight: bold;
-        margin: 0.5rem 0;
-        line-height: 1;
-    }
-    
-    .hero-subtitle {
-        font-size: 1rem;
-        opacity: 0.95;
-        margin-bottom: 1rem;
-    }
-    
-    .hero-context {
-        background: rgba(255, 255, 255, 0.2);
-        border-radius: 12px;
-        padding: 1rem;
-        margin-top: 1rem;
-        font-size: 0.875rem;
-        backdrop-filter: blur(10px);
-    }
-    
-    /* Section Headers */
-    .section-header {
-        font-size: 1.125rem;
-        font-weight: 600;
-        color: #111827;
-        margin: 1.5rem 0 0.75rem 0;
-    }
-    
-    /* Stress Scenario Cards - Horizontal Scroll */
-    .scenarios-container {
-        display: flex;
-        gap: 0.75rem;
-        overflow-x: auto;
-        padding: 0.5rem 0 1rem 0;
-        margin: 0 -1rem;
-        padding-left: 1rem;
-        padding-right: 1rem;
-        -webkit-overflow-scrolling: touch;
-    }
-    
-    .scenario-card {
-        background: white;
-        border-radius: 16px;
-        padding: 1.25rem;
-        min-width: 140px;
-        text-align: center;
-        box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        border-top: 3px solid var(--border-color);
-        flex-shrink: 0;
-    }
-    
-    .scenario-icon {
-        font-size: 2.5rem;
-        margin-bottom: 0.5rem;
-    }
-    
-    .scenario-loss {
-        font-size: 2rem;
-        font-weight: bold;
-        margin-bottom: 0.25rem;
-        color: var(--text-color);
-    }
-    
-    .scenario-name {
-        font-size: 0.75rem;
-        color: #6b7280;
-        font-weight: 500;
-    }
-    
-    /* Key Metrics Grid */
-    .metrics-grid {
-        display: grid;
-        grid-template-columns: 1fr 1fr;
-        gap: 0.75rem;
-        margin: 1rem 0;
-    }
-    
-    .metric-card {
-        background: white;
-        border-radius: 16px;
-        padding: 1.25rem;
-        box-shadow: 0 2px 8px rgba(0,0,0,0.08);
-        text-align: center;
-    }
-    
-    .metric-label {
-        font-size: 0.75rem;
-        color: #6b7280;
-        text-transform: uppercase;
-        letter-spacing: 0.05em;
-        margin-bottom: 0.5rem;
-    }
-    
-    .metric-value {
-        font-size: 1.75rem;
-        font-weight: bold;
-        color: #111827;
-    }
-    
-    .metric-subtitle {
-        font-size: 0.75rem;
-        color: #6b7280;
-        margin-top: 0.25rem;
-    }
-    
-    /* Insight Box */
-    .insight-box {
-        background: #f9fafb;
-        border-radius: 16px;
-        padding: 1.25rem;
-        margin: 1rem 0;
-        border-left: 4px solid #3b82f6;
-    }
-    
-    .insight-title {
-        display: flex;
-        align-items: center;
-        gap: 0.5rem;
-        font-weight: 600;
-        color: #111827;
-        margin-bottom: 0.5rem;
-    }
-    
-    .insight-text {
-        font-size: 0.875rem;
-        color: #6b7280;
-        line-height: 1.5;
-    }
-    
-    /* Action Buttons */
-    .action-section {
-        background: white;
-        border-radius: 16px;
-        padding: 1.25rem;
-        margin: 1rem 0;
-        box-shadow: 0 2px 8px rgba(0,0,0,0.08);
-    }
-    
-    /* Resilience Badge Colors */
-    .resilience-weak { color: #ef4444; }
-    .resilience-moderate { color: #f97316; }
-    .resilience-strong { color: #10b981; }
-</style>
-""", unsafe_allow_html=True)
+# Allocation given to each quick hedge; existing holdings scale down to make room
+QUICK_HEDGE_WEIGHT = 0.10
+
+# Resilience score floors (a score on a floor belongs to that band)
+RESILIENCE_BANDS = (40, 70)
+RESILIENCE_CLASSES = ("resilience-weak", "resilience-moderate", "resilience-strong")
+
+# Sharpe ratio band tops (a band starts strictly above its floor)
+SHARPE_BANDS = (0.5, 1.0)
+SHARPE_COLORS = ("#ef4444", "#f59e0b", "#10b981")
+
+# "What This Means" insight per worst-case band: losses of (-inf, 20], (20, 30], (30, inf)
+WORST_CASE_BANDS = (20, 30)
+WORST_CASE_INSIGHTS = (
+    (
+        "✓",
+        "Well-Protected Portfolio",
+        "Your portfolio shows good resilience. Even in a {worst_name} scenario, losses would be limited to {worst_case:.0f}%. Continue monitoring risk levels and maintain diversification.",
+        "#10b981",
+        "good_portfolio"
+    ),
+    (
+        "⚡",
+        "Moderate Risk Level",
+        "Your portfolio has moderate exposure to market crashes. A {worst_name}-style event could result in a {worst_case:.0f}% loss. Review your hedging strategy to protect against downside scenarios.",
+        "#f97316",
+        "high_volatility"
+    ),
+    (
+        "⚠️",
+        "High Risk Detected",
+        "Your portfolio shows significant vulnerability to major market downturns. In a severe crisis like {worst_name}, you could lose over {worst_case:.0f}% of your value. Consider adding defensive assets like bonds or gold to reduce downside risk.",
+        "#ef4444",
+        "high_risk"
+    ),
+)
+
+# Annual -> daily / monthly volatility scaling
+SQRT_TRADING_DAYS = math.sqrt(252)
+SQRT_MONTHS = math.sqrt(12)
+
+# Emoji and accent color per stress scenario (DEFAULT_SCENARIO_ICON for anything else)
+SCENARIO_ICONS = {
+    '2008 Crisis': ('🔥', '#ef4444'),
+    'COVID 2020': ('🌊', '#f97316'),
+    'Dot Com': ('💻', '#f59e0b'),
+    'Correction': ('⚡', '#fbbf24'),
+    'Flash Crash': ('💨', '#84cc16'),
+    'Black Monday': ('📉', '#dc2626'),
+    'Asian Crisis': ('🌏', '#fb923c'),
+    'Oil Shock': ('🛢️', '#f87171')
+}
+DEFAULT_SCENARIO_ICON = ('📊', '#6b7280')
+
+# Stress scenario card; --border-color/--text-color feed the .scenario-card CSS
+SCENARIO_CARD_TMPL = (
+    '<div class="scenario-card" style="--border-color: {color}; --text-color: {color};">'
+    '<div class="scenario-icon">{icon}</div>'
+    '<div class="scenario-loss">-{loss:.0f}%</div>'
+    '<div class="scenario-name">{name}</div>'
+    '</div>'
+)
+
+RISK_HERO_TMPL = """
+<div class="risk-hero">
+    <div class="hero-label">Worst Case Scenario</div>
+    <div class="hero-value">-{worst_case:.0f}%</div>
+    <div class="hero-subtitle">{worst_name}</div>
+    <div class="hero-context">
+        💡 Your portfolio would lose ${worst_loss:.0f} in a similar crisis
+    </div>
+    <div style="margin-top: 1rem; padding-top: 1rem; border-top: 1px solid rgba(255,255,255,0.2);">
+        <div style="font-size: 0.75rem; opacity: 0.8; margin-bottom: 0.25rem;">Portfolio Resilience</div>
+        <div style="font-size: 2rem; font-weight: bold;" class="{resilience_class}">{resilience}/100</div>
+    </div>
+</div>
+"""
+
+# Key risk metric card (.metric-card styles); title gives the hover tooltip and
+# the <details> toggle makes the same help text reachable by tap on touch screens
+METRIC_CARD_TMPL = (
+    '<div class="metric-card" title="{tooltip}">'
+    '<div class="metric-label">{label}</div>'
+    '<div class="metric-value" style="color: {color};">{value}</div>'
+    '<div class="metric-subtitle">{subtitle}</div>'
+    '<details class="metric-help"><summary>ⓘ What is this?</summary>'
+    '<div class="metric-help-text">{tooltip}</div></details>'
+    '</div>'
+)
+
+# Tile in the "View All Scenarios" grid
+SCENARIO_TILE_TMPL = """
+<div style="background: white; border-radius: 12px; padding: 1rem; 
+            border-left: 4px solid {color}; margin-bottom: 0.5rem;">
+    <div style="font-size: 1.5rem; margin-bottom: 0.25rem;">{icon}</div>
+    <div style="font-size: 1.5rem; font-weight: bold; color: {color};">
+        -{loss:.1f}%
+    </div>
+    <div style="font-size: 0.75rem; color: #6b7280; margin-top: 0.25rem;">
+        {name}
+    </div>
+</div>
+"""
+
+# Markdown body of the "Volatility Context" block in Advanced Risk Details
+VOLATILITY_CONTEXT_TMPL = """
+**What volatility means for you:**
+- **Daily:** Typical move of ±{daily_vol:.2f}%
+- **Monthly:** Typical range of ±{monthly_vol:.1f}%
+- **Annual:** Expected range of ±{current_vol:.1f}%
+
+On 95% of days, your portfolio won't lose more than {var_95:.1f}%. 
+On the worst 5% of days, average loss is {cvar_95:.1f}% (CVaR).
+"""
+
+INSIGHT_BOX_TMPL = """
+<div class="insight-box" style="border-left-color: {color};">
+    <div class="insight-title">
+        <span style="font-size: 1.5rem;">{icon}</span>
+        <span>{title}</span>
+    </div>
+    <div class="insight-text">{text}</div>
+</div>
+"""
+
+# Filled straight from a quick_hedges entry via format_map
+HEDGE_CARD_TMPL = """
+<div style="background: white; border-radius: 12px; padding: 1rem; margin: 0.5rem 0; 
+            box-shadow: 0 2px 8px rgba(0,0,0,0.08); border-left: 4px solid {color};">
+    <div style="font-weight: 600; color: #111827; margin-bottom: 0.25rem;">
+        {symbol} - {name}
+    </div>
+    <div style="font-size: 0.75rem; color: #6b7280; margin-bottom: 0.25rem;">
+        {description}
+    </div>
+    <div style="font-size: 0.75rem; color: {color}; font-weight: 500;">
+        💡 {expected_impact}
+    </div>
+</div>
+"""
+
+OPTIMAL_HEDGE_CARD_TMPL = """
+<div style="background: #f9fafb; border-radius: 12px; padding: 1rem; 
+            margin: 0.75rem 0; border-left: 4px solid {color};">
+    <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.5rem;">
+        <div style="font-weight: 600; color: #111827; font-size: 1rem;">
+            {emoji} {rank}. {symbol}
+        </div>
+        <div style="background: {color}; color: white; padding: 0.25rem 0.75rem; 
+                    border-radius: 12px; font-size: 0.75rem; font-weight: 600;">
+            Score: {score:.3f}
+        </div>
+    </div>
+    <div style="font-size: 0.875rem; color: #6b7280; line-height: 1.6;">
+        <strong>Category:</strong> {category}<br/>
+        <strong>CVaR Improvement:</strong> {cvar_improvement:.1f}% better<br/>
+        <strong>Volatility Reduction:</strong> {volatility_reduction:.1f}%<br/>
+        <strong>Correlation:</strong> {correlation:.2f}
+    </div>
+</div>
+"""
+
 
 # Get portfolio from session state using portfolio_manager
 symbols, weights = get_portfolio()
 
 if not symbols:
     st.warning("📊 No portfolio loaded")
-    if st.button("← Back to Home", use_container_width=True):
-        st.switch_page("Home.py")
+    st.page_link("Home.py", label="← Back to Home", use_container_width=True)
     st.stop()
 
-# Helper function
-def safe_extract(data, *keys, default=0):
-    """Safely extract nested dictionary values"""
-    result = data
-    for key in keys:
-        if isinstance(result, dict):
-            result = result.get(key, default)
-        else:
-            return default
-    return result if result is not None else default
-
-# Load data once at the top
-with st.spinner("Analyzing portfolio risk..."):
-    try:
-        client = get_api_client()
-        
-        # Convert to tuples for caching
-        symbols_tuple = tuple(symbols)
-        weights_tuple = tuple(weights)
-        
-        # Get both stress test and risk metrics (CACHED!)
-        stress_response = client.run_stress_test(symbols_tuple, weights_tuple)
-        risk_response = client.get_risk_analysis(symbols_tuple, weights_tuple)
-        
-        # Parse stress test data
-        if stress_response.get('status') == 'success':
-            results = stress_response.get('stress_test_results', {})
-            scenarios = results.get('stress_scenarios', {})
-            
-            scenario_data = []
-            for name, data in scenarios.items():
-                if isinstance(data, dict):
-                    loss = abs(safe_extract(data, 'total_loss_pct', default=0))
-                    if loss < 1 and loss > 0:
-                        loss = loss * 100
-                elif isinstance(data, (int, float)):
-                    loss = abs(data)
-                    if loss < 1:
-                        loss = loss * 100
-                else:
-                    loss = 0
-                
-                scenario_data.append({
-                    'name': name.replace('_', ' ').title(),
-                    'loss': loss
-                })
-            
-            # Sort by severity
-            scenario_data.sort(key=lambda x: x['loss'], reverse=True)
-            
-            worst_case = scenario_data[0]['loss'] if scenario_data else 25.0
-            worst_name = scenario_data[0]['name'] if scenario_data else "Market Crisis"
-            avg_loss = sum(s['loss'] for s in scenario_data) / len(scenario_data) if scenario_data else 15.0
-            resilience = int(max(0, 100 - worst_case))
-        else:
-            # Fallback data
-            scenario_data = [
-                {'name': '2008 Crisis', 'loss': 37.0},
-                {'name': 'COVID 2020', 'loss': 34.0},
-                {'name': 'Correction', 'loss': 20.0},
-                {'name': 'Flash Crash', 'loss': 9.0}
-            ]
-            worst_case = 37.0
-            worst_name = "2008 Crisis"
-            avg_loss = 25.0
-            resilience = 63
-        
-        # Parse risk metrics
-        if 'metrics' in risk_response:
-            metrics = risk_response['metrics']
-            current_vol = safe_extract(metrics, 'annualized_volatility', default=0)
-            var_95 = abs(safe_extract(metrics, 'portfolio_var_95', default=0))
-            cvar_95 = abs(safe_extract(metrics, 'portfolio_cvar_95', default=0))
-            sharpe = safe_extract(metrics, 'sharpe_ratio', default=0)
-            
-            # Convert to percentages
-            if current_vol < 1: current_vol *= 100
-            if var_95 < 1: var_95 *= 100
-            if cvar_95 < 1: cvar_95 *= 100
-        else:
-            current_vol = 20.0
-            var_95 = 2.5
-            cvar_95 = 3.2
-            sharpe = 1.2
-        
-        data_loaded = True
-        
-    except Exception as e:
-        st.error(f"Unable to load risk data: {str(e)}")
-        data_loaded = False
-
-# NEW: Check if a scenario modal is active - SHOW MODAL INSTEAD OF PAGE
+# Scenario modal replaces the page; checked before the page CSS and the risk
+# data load, neither of which the modal uses
 if is_scenario_modal_active():
     selected_scenario = get_active_scenario()
     
@@ -372,247 +280,131 @@ if is_scenario_modal_active():
     # Stop here - don't show the rest of the page
     st.stop()
 
-# Only show content if data loaded
-if data_loaded:
-    
-    # 1. HERO CARD - Worst Case Scenario WITH TOOLTIPS
-    resilience_class = (
-        "resilience-strong" if resilience >= 70 
-        else "resilience-moderate" if resilience >= 40 
-        else "resilience-weak"
-    )
+# Enhanced iOS-style CSS (stylesheet is read from disk once per process)
+inject_css("risk.css")
 
-    st.markdown(f"""
-    <div class="risk-hero">
-        <div class="hero-label">Worst Case Scenario</div>
-        <div class="hero-value">-{worst_case:.0f}%</div>
-        <div class="hero-subtitle">{worst_name}</div>
-        <div class="hero-context">
-            💡 Your portfolio would lose ${worst_case * 1274.85:.0f} in a similar crisis
-        </div>
-        <div style="margin-top: 1rem; padding-top: 1rem; border-top: 1px solid rgba(255,255,255,0.2);">
-            <div style="font-size: 0.75rem; opacity: 0.8; margin-bottom: 0.25rem;">Portfolio Resilience</div>
-            <div style="font-size: 2rem; font-weight: bold;" class="{resilience_class}">{resilience}/100</div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+# Helper function
+def safe_extract(data, *keys, default=0):
+    """Safely extract nested dictionary values"""
+    # Keys are normally present, so index directly and treat any miss as the default
+    try:
+        for key in keys:
+            data = data[key]
+    except (KeyError, TypeError, IndexError):
+        return default
+    return data if data is not None else default
+
+@st.cache_data(ttl=300, show_spinner=False)  # Same lifetime as the API responses it's built from
+def load_risk_summary(symbols_tuple: tuple, weights_tuple: tuple) -> dict:
+    """
+    Fetch stress test + risk metrics and reduce them to the values the page renders
+    
+    Args:
+        symbols_tuple: Portfolio symbols (tuple for caching)
+        weights_tuple: Portfolio weights (tuple for caching)
+    
+    Returns:
+        Dictionary with scenario_data, worst_case, worst_name, avg_loss,
+        resilience, current_vol, var_95, cvar_95, and sharpe
+    """
+    client = get_api_client()
+    
+    # Get both stress test and risk metrics (st.cache_data on the client, keyed on the tuples).
+    # Independent requests, so overlap them: a cold load waits for the slower one, not both
+    stress_response, risk_response = fetch_concurrently(
+        lambda: client.run_stress_test(symbols_tuple, weights_tuple),
+        lambda: client.get_risk_analysis(symbols_tuple, weights_tuple)
+    )
 
-    # Tooltips for worst case and resilience
-    col1, col2 = st.columns(2)
+    # Parse stress test data
+    if stress_response.get('status') == 'success':
+        results = stress_response.get('stress_test_results', {})
+        scenarios = results.get('stress_scenarios', {})
 
-    with col1:
-        with st.expander("ℹ️ What is Worst Case Scenario?"):
-            st.markdown(tooltip_icon("worst_case", inline=False))
+        # Normalized to percent and sorted by severity
+        scenario_data, avg_loss = rank_stress_scenarios(scenarios)
 
-    with col2:
-        with st.expander("ℹ️ What is Portfolio Resilience?"):
-            st.markdown(tooltip_icon("resilience", inline=False))
-    
-    # 2. STRESS SCENARIOS - NOW INTERACTIVE! 🎉
-    st.markdown('<div class="section-header">All Stress Scenarios</div>', unsafe_allow_html=True)
-    
-    st.markdown("""
-    <div style="color: #6b7280; font-size: 0.875rem; margin-bottom: 0.75rem;">
-        👆 Tap any scenario to see detailed historical analysis
-    </div>
-    """, unsafe_allow_html=True)
+        worst_case = scenario_data[0]['loss'] if scenario_data else 25.0
+        worst_name = scenario_data[0]['name'] if scenario_data else "Market Crisis"
+        avg_loss = avg_loss if scenario_data else 15.0
+        resilience = int(max(0, 100 - worst_case))
+    else:
+        # Fallback data
+        scenario_data = [
+            {'name': '2008 Crisis', 'loss': 37.0},
+            {'name': 'COVID 2020', 'loss': 34.0},
+            {'name': 'Correction', 'loss': 20.0},
+            {'name': 'Flash Crash', 'loss': 9.0}
+        ]
+        worst_case = 37.0
+        worst_name = "2008 Crisis"
+        avg_loss = 25.0
+        resilience = 63
+
+    # Attach display icon/color here so cache hits render without per-row lookups
+    for scenario in scenario_data:
+        scenario['icon'], scenario['color'] = SCENARIO_ICONS.get(scenario['name'], DEFAULT_SCENARIO_ICON)
+    
+    # Parse risk metrics
+    if 'metrics' in risk_response:
+        metrics = risk_response['metrics']
+        current_vol = safe_extract(metrics, 'annualized_volatility', default=0)
+        var_95 = abs(safe_extract(metrics, 'portfolio_var_95', default=0))
+        cvar_95 = abs(safe_extract(metrics, 'portfolio_cvar_95', default=0))
+        sharpe = safe_extract(metrics, 'sharpe_ratio', default=0)
+
+        # Convert to percentages
+        if current_vol < 1: current_vol *= 100
+        if var_95 < 1: var_95 *= 100
+        if cvar_95 < 1: cvar_95 *= 100
+    else:
+        current_vol = 20.0
+        var_95 = 2.5
+        cvar_95 = 3.2
+        sharpe = 1.2
     
-    # Map scenarios to emojis and colors
-    scenario_icons = {
-        '2008 Crisis': ('🔥', '#ef4444'),
-        'COVID 2020': ('🌊', '#f97316'),
-        'Dot Com': ('💻', '#f59e0b'),
-        'Correction': ('⚡', '#fbbf24'),
-        'Flash Crash': ('💨', '#84cc16'),
-        'Black Monday': ('📉', '#dc2626'),
-        'Asian Crisis': ('🌏', '#fb923c'),
-        'Oil Shock': ('🛢️', '#f87171')
+    return {
+        'scenario_data': scenario_data,
+        'worst_case': worst_case,
+        'worst_name': worst_name,
+        'avg_loss': avg_loss,
+        'resilience': resilience,
+        'current_vol': current_vol,
+        'var_95': var_95,
+        'cvar_95': cvar_95,
+        'sharpe': sharpe
     }
-    
-    # Create clickable cards - Top 4 scenarios
-    cols = st.columns(min(len(scenario_data), 4))
-    
-    for idx, scenario in enumerate(scenario_data[:4]):
-        icon, color = scenario_icons.get(scenario['name'], ('📊', '#6b7280'))
-        
-        with cols[idx]:
-            st.markdown(f"""
-            <div style="background: white; border-radius: 16px; padding: 1.25rem; min-width: 140px;
-                        text-align: center; box-shadow: 0 2px 8px rgba(0,0,0,0.1); 
-                        border-top: 3px solid {color}; margin-bottom: 0.5rem;">
-                <div style="font-size: 2.5rem; margin-bottom: 0.5rem;">{icon}</div>
-                <div style="font-size: 2rem; font-weight: bold; margin-bottom: 0.25rem; color: {color};">
-                    -{scenario['loss']:.0f}%
-                </div>
-                <div style="font-size: 0.75rem; color: #6b7280; font-weight: 500;">
-                    {scenario['name']}
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # Clickable button below each card
-            if st.button("View Details", key=f"scenario_card_{scenario['name']}", use_container_width=True):
-                activate_scenario_modal(scenario['name'])
-                st.rerun()
-    
-    # Show all scenarios in expandable section
-    with st.expander(f"📊 View All {len(scenario_data)} Scenarios"):
-        # Create a grid of all scenarios
-        for i in range(0, len(scenario_data), 2):
-            col1, col2 = st.columns(2)
-            
-            # First scenario in row
-            with col1:
-                if i < len(scenario_data):
-                    scenario = scenario_data[i]
-                    icon, color = scenario_icons.get(scenario['name'], ('📊', '#6b7280'))
-                    
-                    st.markdown(f"""
-                    <div style="background: white; border-radius: 12px; padding: 1rem; 
-                                border-left: 4px solid {color}; margin-bottom: 0.5rem;">
-                        <div style="font-size: 1.5rem; margin-bottom: 0.25rem;">{icon}</div>
-                        <div style="font-size: 1.5rem; font-weight: bold; color: {color};">
-                            -{scenario['loss']:.1f}%
-                        </div>
-                        <div style="font-size: 0.75rem; color: #6b7280; margin-top: 0.25rem;">
-                            {scenario['name']}
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    if st.button("View Details", key=f"detail_{i}", use_container_width=True):
-                        activate_scenario_modal(scenario['name'])
-                        st.rerun()
-            
-            # Second scenario in row
-            with col2:
-                if i + 1 < len(scenario_data):
-                    scenario = scenario_data[i + 1]
-                    icon, color = scenario_icons.get(scenario['name'], ('📊', '#6b7280'))
-                    
-                    st.markdown(f"""
-                    <div style="background: white; border-radius: 12px; padding: 1rem; 
-                                border-left: 4px solid {color}; margin-bottom: 0.5rem;">
-                        <div style="font-size: 1.5rem; margin-bottom: 0.25rem;">{icon}</div>
-                        <div style="font-size: 1.5rem; font-weight: bold; color: {color};">
-                            -{scenario['loss']:.1f}%
-                        </div>
-                        <div style="font-size: 0.75rem; color: #6b7280; margin-top: 0.25rem;">
-                            {scenario['name']}
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    if st.button("View Details", key=f"detail_{i+1}", use_container_width=True):
-                        activate_scenario_modal(scenario['name'])
-                        st.rerun()
-    
-    # 3. KEY RISK METRICS - 2x2 Grid WITH TOOLTIPS
-    st.markdown('<div class="section-header">Key Risk Metrics</div>', unsafe_allow_html=True)
 
-    # Row 1
-    col1, col2 = st.columns(2)
-
-    with col1:
-        # Volatility with tooltip
-        show_metric_with_tooltip(
-            label="Volatility",
-            value=f"{current_vol:.1f}%",
-            metric_key="volatility"
-        )
-        st.caption("Annual")
-
-    with col2:
-        # VaR with tooltip
-        show_metric_with_tooltip(
-            label="VaR (95%)",
-            value=f"{var_95:.1f}%",
-            metric_key="var"
-        )
-        st.caption("Daily max loss")
-
-    # Row 2
-    col3, col4 = st.columns(2)
-
-    with col3:
-        # CVaR with tooltip
-        show_metric_with_tooltip(
-            label="Tail Risk",
-            value=f"{cvar_95:.1f}%",
-            metric_key="cvar"
-        )
-        st.caption("CVaR (95%)")
-
-    with col4:
-        # Sharpe with tooltip
-        sharpe_color = "#10b981" if sharpe > 1 else "#f59e0b" if sharpe > 0.5 else "#ef4444"
-        show_metric_with_tooltip(
-            label="Sharpe Ratio",
-            value=f"{sharpe:.2f}",
-            metric_key="sharpe_ratio"
-        )
-        st.caption("Risk-adjusted")
-
-    # Add "Learn More" section for all metrics
-    with st.expander("📚 Understanding These Metrics"):
-        tab1, tab2, tab3, tab4 = st.tabs(["Volatility", "VaR", "CVaR/Tail Risk", "Sharpe Ratio"])
-        
-        with tab1:
-            st.markdown(tooltip_icon("volatility", inline=False))
-        
-        with tab2:
-            st.markdown(tooltip_icon("var", inline=False))
-        
-        with tab3:
-            st.markdown(tooltip_icon("cvar", inline=False))
-        
-        with tab4:
-            st.markdown(tooltip_icon("sharpe_ratio", inline=False))
-    
-    # 4. INTERPRETATION - What This Means
-    st.markdown('<div class="section-header">What This Means</div>', unsafe_allow_html=True)
-
-    # Generate contextual insight
-    if worst_case > 30:
-        insight_icon = "⚠️"
-        insight_title = "High Risk Detected"
-        insight_text = f"Your portfolio shows significant vulnerability to major market downturns. In a severe crisis like {worst_name}, you could lose over {worst_case:.0f}% of your value. Consider adding defensive assets like bonds or gold to reduce downside risk."
-        border_color = "#ef4444"
-        tip_scenario = "high_risk"
-    elif worst_case > 20:
-        insight_icon = "⚡"
-        insight_title = "Moderate Risk Level"
-        insight_text = f"Your portfolio has moderate exposure to market crashes. A {worst_name}-style event could result in a {worst_case:.0f}% loss. Review your hedging strategy to protect against downside scenarios."
-        border_color = "#f97316"
-        tip_scenario = "high_volatility"
-    else:
-        insight_icon = "✓"
-        insight_title = "Well-Protected Portfolio"
-        insight_text = f"Your portfolio shows good resilience. Even in a {worst_name} scenario, losses would be limited to {worst_case:.0f}%. Continue monitoring risk levels and maintain diversification."
-        border_color = "#10b981"
-        tip_scenario = "good_portfolio"
-
-    st.markdown(f"""
-    <div class="insight-box" style="border-left-color: {border_color};">
-        <div class="insight-title">
-            <span style="font-size: 1.5rem;">{insight_icon}</span>
-            <span>{insight_title}</span>
-        </div>
-        <div class="insight-text">{insight_text}</div>
-    </div>
-    """, unsafe_allow_html=True)
-
-    # Show contextual tip based on risk level
-    show_contextual_tip(tip_scenario)
-    
-    # 5. RECOMMENDED ACTIONS
-    st.markdown('<div class="section-header">Recommended Actions</div>', unsafe_allow_html=True)
-    
-    if st.button("🎯 Optimize Portfolio", use_container_width=True, type="primary"):
-        st.session_state['action'] = 'optimization'
-        st.switch_page("pages/4_Copilot.py")
+def clear_hedge_analysis():
+    """Force re-run button callback: drop cached hedge analyses so the next call refetches"""
+    get_api_client().analyze_hedge_opportunities.clear()
+
+def retry_risk_data():
+    """Retry button callback: drop cached stress/risk responses so the rerun refetches"""
+    client = get_api_client()
+    client.run_stress_test.clear()
+    client.get_risk_analysis.clear()
+    load_risk_summary.clear()
+
+def open_picked_scenario():
+    """Scenario picker callback: open the modal and clear the pick so it can be chosen again"""
+    picked = st.session_state.get('scenario_pick')
+    if picked:
+        activate_scenario_modal(picked)
+    st.session_state['scenario_pick'] = None
+
+@st.fragment
+def hedge_section(symbols: list, weights: list):
+    """
+    Quick hedge cards, hedge preview, and advanced hedge analysis
+    
+    Runs as a fragment so Preview/Cancel clicks (state flips in on_click
+    callbacks) rerun only this section instead of re-rendering the hero,
+    scenarios, and metrics above it; confirming a hedge changes the portfolio
+    and still reruns the whole page.
+    """
+    client = get_api_client()
     
-    # 6. HEDGING SECTION (INTEGRATED WITH PREVIEW)
     st.markdown("---")
     st.markdown('<div class="section-header">🛡️ Protect Your Portfolio</div>', unsafe_allow_html=True)
     
@@ -662,23 +454,30 @@ if data_loaded:
             hedge_description=active_preview['description'],
             current_symbols=symbols,
             current_weights=weights,
-            hedge_weight=0.10
+            hedge_weight=QUICK_HEDGE_WEIGHT
         )
         
         if confirmed:
             # User confirmed - add the hedge
-            hedge_weight = 0.10
+            hedge_weight = QUICK_HEDGE_WEIGHT
             scale_factor = 1 - hedge_weight
             
+            if active_preview['symbol'] in symbols:
+                # Already held (e.g. a repeated confirm): nothing changes, so skip the
+                # portfolio write and the full-page rerun that would refetch risk data
+                st.toast(f"{active_preview['symbol']} is already in your portfolio")
+                st.rerun(scope="fragment")
+            
             if symbols and weights:
                 new_symbols = symbols + [active_preview['symbol']]
                 new_weights = [w * scale_factor for w in weights] + [hedge_weight]
                 
                 set_portfolio(new_symbols, new_weights)
                 
-                st.success(f"✓ Added {active_preview['symbol']} ({hedge_weight*100:.0f}% allocation)")
-                st.balloons()
-                time.sleep(1.5)
+                # Toast survives the rerun, so there's no need to hold the script to show it
+                st.toast(f"✓ Added {active_preview['symbol']} ({hedge_weight*100:.0f}% allocation)", icon="🎯")
+                
+                # Portfolio changed, so the whole page (not just this fragment) reruns
                 st.rerun()
     
     else:
@@ -687,26 +486,40 @@ if data_loaded:
             col1, col2 = st.columns([5, 1])
             
             with col1:
-                st.markdown(f"""
-                <div style="background: white; border-radius: 12px; padding: 1rem; margin: 0.5rem 0; 
-                            box-shadow: 0 2px 8px rgba(0,0,0,0.08); border-left: 4px solid {hedge['color']};">
-                    <div style="font-weight: 600; color: #111827; margin-bottom: 0.25rem;">
-                        {hedge['symbol']} - {hedge['name']}
-                    </div>
-                    <div style="font-size: 0.75rem; color: #6b7280; margin-bottom: 0.25rem;">
-                        {hedge['description']}
-                    </div>
-                    <div style="font-size: 0.75rem; color: {hedge['color']}; font-weight: 500;">
-                        💡 {hedge['expected_impact']}
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(HEDGE_CARD_TMPL.format_map(hedge), unsafe_allow_html=True)
             
             with col2:
                 st.markdown("<div style='height: 12px;'></div>", unsafe_allow_html=True)  # Spacer
-                if st.button("Preview", key=f"preview_hedge_{hedge['symbol']}", use_container_width=True):
-                    activate_hedge_preview(hedge['symbol'])
-                    st.rerun()
+                st.button(
+                    "Preview",
+                    key=f"preview_hedge_{hedge['symbol']}",
+                    use_container_width=True,
+                    on_click=activate_hedge_preview,
+                    args=(hedge['symbol'],)
+                )
+        
+        # Adding several quick hedges at once: one submit, one rerun
+        addable = [hedge['symbol'] for hedge in quick_hedges if hedge['symbol'] not in symbols]
+        
+        if addable and symbols and weights:
+            with st.form("quick_hedge_form", clear_on_submit=True, border=False):
+                chosen = st.multiselect(
+                    f"Add several hedges ({QUICK_HEDGE_WEIGHT*100:.0f}% each)",
+                    addable,
+                    key="quick_hedge_choice"
+                )
+                submitted = st.form_submit_button("Add Selected Hedges", use_container_width=True)
+            
+            if submitted and chosen:
+                scale_factor = 1 - QUICK_HEDGE_WEIGHT * len(chosen)
+                new_symbols = symbols + chosen
+                new_weights = [w * scale_factor for w in weights] + [QUICK_HEDGE_WEIGHT] * len(chosen)
+                
+                set_portfolio(new_symbols, new_weights)
+                st.toast(f"✓ Added {', '.join(chosen)}", icon="🎯")
+                
+                # Portfolio changed, so the whole page (not just this fragment) reruns
+                st.rerun()
     
     # Advanced hedge analysis (expandable)
     with st.expander("🔍 Advanced Hedge Analysis"):
@@ -717,7 +530,22 @@ if data_loaded:
         This analyzes correlations, tail risk reduction, and impact on your worst-case scenarios.
         """)
         
-        if st.button("Run Advanced Analysis", use_container_width=True, type="primary", key="advanced_hedge"):
+        col1, col2 = st.columns([3, 1])
+        
+        with col1:
+            run_clicked = st.button("Run Advanced Analysis", use_container_width=True, type="primary", key="advanced_hedge")
+        
+        with col2:
+            # Results are cached for an hour per portfolio; this drops them first
+            force_clicked = st.button(
+                "🔄 Force re-run",
+                use_container_width=True,
+                key="advanced_hedge_force",
+                help="Ignore cached results and analyze again",
+                on_click=clear_hedge_analysis
+            )
+        
+        if run_clicked or force_clicked:
             # Create placeholder for progress updates
             progress_placeholder = st.empty()
             status_text = st.empty()
@@ -726,12 +554,10 @@ if data_loaded:
                 # Show initial status
                 status_text.info("🔍 Analyzing your portfolio...")
                 
-                # Convert to tuples for caching
-                symbols_tuple = tuple(symbols)
-                weights_tuple = tuple(weights)
+                # Cache-key tuples, built once per portfolio change
+                symbols_tuple, weights_tuple = get_portfolio_key()
                 
                 # Start analysis with progress callback
-                import time
                 start_time = time.time()
                 
                 # Show analyzing status
@@ -763,6 +589,8 @@ if data_loaded:
                 status_text.empty()
                 
                 if "error" in hedge_response:
+                    # Don't let a failed/timed-out analysis sit in the 1-hour cache
+                    client.analyze_hedge_opportunities.clear()
                     st.error(f"❌ {hedge_response['error']}")
                 elif hedge_response.get('status') == 'success':
                     top_hedges = hedge_response.get('top_hedges', [])
@@ -787,33 +615,31 @@ if data_loaded:
                                 border_color = "#6b7280"  # Gray - okay
                                 score_emoji = "✓"
                             
-                            st.markdown(f"""
-                            <div style="background: #f9fafb; border-radius: 12px; padding: 1rem; 
-                                        margin: 0.75rem 0; border-left: 4px solid {border_color};">
-                                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.5rem;">
-                                    <div style="font-weight: 600; color: #111827; font-size: 1rem;">
-                                        {score_emoji} {i}. {hedge['symbol']}
-                                    </div>
-                                    <div style="background: {border_color}; color: white; padding: 0.25rem 0.75rem; 
-                                                border-radius: 12px; font-size: 0.75rem; font-weight: 600;">
-                                        Score: {hedge.get('score', 0):.3f}
-                                    </div>
-                                </div>
-                                <div style="font-size: 0.875rem; color: #6b7280; line-height: 1.6;">
-                                    <strong>Category:</strong> {hedge.get('category', 'Unknown')}<br/>
-                                    <strong>CVaR Improvement:</strong> {hedge.get('cvar_improvement', 0)*100:.1f}% better<br/>
-                                    <strong>Volatility Reduction:</strong> {hedge.get('volatility_reduction', 0)*100:.1f}%<br/>
-                                    <strong>Correlation:</strong> {hedge.get('correlation', 0):.2f}
-                                </div>
-                            </div>
-                            """, unsafe_allow_html=True)
+                            st.markdown(
+                                OPTIMAL_HEDGE_CARD_TMPL.format(
+                                    color=border_color,
+                                    emoji=score_emoji,
+                                    rank=i,
+                                    symbol=hedge['symbol'],
+                                    score=hedge.get('score', 0),
+                                    category=hedge.get('category', 'Unknown'),
+                                    cvar_improvement=hedge.get('cvar_improvement', 0) * 100,
+                                    volatility_reduction=hedge.get('volatility_reduction', 0) * 100,
+                                    correlation=hedge.get('correlation', 0)
+                                ),
+                                unsafe_allow_html=True
+                            )
                             
                             # Add preview button
                             col1, col2 = st.columns([3, 1])
                             with col2:
-                                if st.button(f"Preview", key=f"preview_optimal_{hedge['symbol']}", use_container_width=True):
-                                    activate_hedge_preview(hedge['symbol'])
-                                    st.rerun()
+                                st.button(
+                                    "Preview",
+                                    key=f"preview_optimal_{hedge['symbol']}",
+                                    use_container_width=True,
+                                    on_click=activate_hedge_preview,
+                                    args=(hedge['symbol'],)
+                                )
                 else:
                     st.error("❌ Analysis failed - check API connection")
             
@@ -835,23 +661,177 @@ if data_loaded:
         
         **⚡ New:** Analysis optimized - now completes in 10-15 seconds instead of 30-40 seconds!
         """)
+
+# Load data once at the top
+with st.spinner("Analyzing portfolio risk..."):
+    try:
+        # Cache-key tuples, built once per portfolio change and reused across reruns
+        symbols_tuple, weights_tuple = get_portfolio_key()
+        
+        # Fetch + parse in one cached step: reruns on the same portfolio skip the
+        # scenario ranking and metric normalization, not just the HTTP requests
+        summary = load_risk_summary(symbols_tuple, weights_tuple)
+        
+        scenario_data = summary['scenario_data']
+        worst_case = summary['worst_case']
+        worst_name = summary['worst_name']
+        avg_loss = summary['avg_loss']
+        resilience = summary['resilience']
+        current_vol = summary['current_vol']
+        var_95 = summary['var_95']
+        cvar_95 = summary['cvar_95']
+        sharpe = summary['sharpe']
+        
+        data_loaded = True
+        
+    except Exception as e:
+        st.error(f"Unable to load risk data: {str(e)}")
+        data_loaded = False
+
+# Only show content if data loaded
+if data_loaded:
+    
+    # 1. HERO CARD - Worst Case Scenario WITH TOOLTIPS
+    resilience_class = RESILIENCE_CLASSES[bisect.bisect_right(RESILIENCE_BANDS, resilience)]
+
+    st.markdown(
+        RISK_HERO_TMPL.format(
+            worst_case=worst_case,
+            worst_name=worst_name,
+            worst_loss=worst_case * 1274.85,
+            resilience_class=resilience_class,
+            resilience=resilience
+        ),
+        unsafe_allow_html=True
+    )
+
+    # Tooltips for worst case and resilience
+    col1, col2 = st.columns(2)
+
+    with col1:
+        with st.expander("ℹ️ What is Worst Case Scenario?"):
+            st.markdown(tooltip_icon("worst_case", inline=False))
+
+    with col2:
+        with st.expander("ℹ️ What is Portfolio Resilience?"):
+            st.markdown(tooltip_icon("resilience", inline=False))
+    
+    # 2. STRESS SCENARIOS - NOW INTERACTIVE! 🎉
+    st.markdown('<div class="section-header">All Stress Scenarios</div>', unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div style="color: #6b7280; font-size: 0.875rem; margin-bottom: 0.75rem;">
+        👇 Pick a scenario below to see detailed historical analysis
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Rows come from load_risk_summary with icon/color already attached
+    top_scenarios = scenario_data[:4]
+    
+    # Top 4 scenarios: all cards in one markdown element (uses the .scenario-card styles)
+    cards_html = "".join(SCENARIO_CARD_TMPL.format_map(scenario) for scenario in top_scenarios)
+    st.markdown(f'<div class="scenarios-container">{cards_html}</div>', unsafe_allow_html=True)
+    
+    # Show all scenarios in expandable section
+    with st.expander(f"📊 View All {len(scenario_data)} Scenarios"):
+        # Every tile in one two-up grid element (.scenario-grid)
+        tiles_html = "".join(SCENARIO_TILE_TMPL.format_map(scenario) for scenario in scenario_data)
+        st.markdown(f'<div class="scenario-grid">{tiles_html}</div>', unsafe_allow_html=True)
+    
+    # One picker for every scenario instead of a button per card/tile
+    scenario_icons = {scenario['name']: scenario['icon'] for scenario in scenario_data}
+    
+    st.radio(
+        "View scenario details",
+        options=list(scenario_icons),
+        format_func=lambda name: f"{scenario_icons[name]} {name}",
+        index=None,
+        key="scenario_pick",
+        horizontal=True,
+        label_visibility="collapsed",
+        on_change=open_picked_scenario
+    )
+    
+    # 3. KEY RISK METRICS - 2x2 Grid WITH TOOLTIPS
+    st.markdown('<div class="section-header">Key Risk Metrics</div>', unsafe_allow_html=True)
+
+    # One grid element for all four cards (.metrics-grid / .metric-card styles);
+    # each card carries st.metric's short help text as a hover title and a tap toggle
+    sharpe_color = SHARPE_COLORS[bisect.bisect_left(SHARPE_BANDS, sharpe)]
+    
+    metric_cards = (
+        ("Volatility", f"{current_vol:.1f}%", "Annual", "volatility", "#111827"),
+        ("VaR (95%)", f"{var_95:.1f}%", "Daily max loss", "var", "#111827"),
+        ("Tail Risk", f"{cvar_95:.1f}%", "CVaR (95%)", "cvar", "#111827"),
+        ("Sharpe Ratio", f"{sharpe:.2f}", "Risk-adjusted", "sharpe_ratio", sharpe_color),
+    )
+    
+    metrics_html = "".join(
+        METRIC_CARD_TMPL.format(
+            label=label,
+            value=value,
+            subtitle=subtitle,
+            tooltip=html.escape(tooltip_icon(metric_key)),
+            color=color
+        )
+        for label, value, subtitle, metric_key, color in metric_cards
+    )
+    st.markdown(f'<div class="metrics-grid">{metrics_html}</div>', unsafe_allow_html=True)
+
+    # Add "Learn More" section for all metrics
+    with st.expander("📚 Understanding These Metrics"):
+        tab1, tab2, tab3, tab4 = st.tabs(["Volatility", "VaR", "CVaR/Tail Risk", "Sharpe Ratio"])
+        
+        with tab1:
+            st.markdown(tooltip_icon("volatility", inline=False))
+        
+        with tab2:
+            st.markdown(tooltip_icon("var", inline=False))
+        
+        with tab3:
+            st.markdown(tooltip_icon("cvar", inline=False))
+        
+        with tab4:
+            st.markdown(tooltip_icon("sharpe_ratio", inline=False))
+    
+    # 4. INTERPRETATION - What This Means
+    st.markdown('<div class="section-header">What This Means</div>', unsafe_allow_html=True)
+
+    # Generate contextual insight (band by worst-case loss, then fill its text template)
+    insight_icon, insight_title, insight_text_tmpl, border_color, tip_scenario = (
+        WORST_CASE_INSIGHTS[bisect.bisect_left(WORST_CASE_BANDS, worst_case)]
+    )
+    insight_text = insight_text_tmpl.format(worst_name=worst_name, worst_case=worst_case)
+
+    st.markdown(
+        INSIGHT_BOX_TMPL.format(color=border_color, icon=insight_icon, title=insight_title, text=insight_text),
+        unsafe_allow_html=True
+    )
+
+    # Show contextual tip based on risk level
+    show_contextual_tip(tip_scenario)
+    
+    # 5. RECOMMENDED ACTIONS
+    st.markdown('<div class="section-header">Recommended Actions</div>', unsafe_allow_html=True)
+    
+    if st.button("🎯 Optimize Portfolio", use_container_width=True, type="primary"):
+        st.session_state['action'] = 'optimization'
+        st.switch_page("pages/4_Copilot.py")
+    
+    # 6. HEDGING SECTION (INTEGRATED WITH PREVIEW)
+    hedge_section(symbols, weights)
     
     # 7. OPTIONAL: Advanced Details (Collapsed by default)
     with st.expander("📊 Advanced Risk Details"):
         st.markdown("### Volatility Context")
         
-        daily_vol = current_vol / np.sqrt(252)
-        monthly_vol = current_vol / np.sqrt(12)
-        
-        st.markdown(f"""
-        **What volatility means for you:**
-        - **Daily:** Typical move of ±{daily_vol:.2f}%
-        - **Monthly:** Typical range of ±{monthly_vol:.1f}%
-        - **Annual:** Expected range of ±{current_vol:.1f}%
-        
-        On 95% of days, your portfolio won't lose more than {var_95:.1f}%. 
-        On the worst 5% of days, average loss is {cvar_95:.1f}% (CVaR).
-        """)
+        st.markdown(VOLATILITY_CONTEXT_TMPL.format(
+            daily_vol=current_vol / SQRT_TRADING_DAYS,
+            monthly_vol=current_vol / SQRT_MONTHS,
+            current_vol=current_vol,
+            var_95=var_95,
+            cvar_95=cvar_95
+        ))
         
         # Add detailed explanations
         show_learn_more_section("volatility")
@@ -883,8 +863,8 @@ else:
     st.error("Unable to load risk analysis")
     st.info("Please check your API connection and try again")
     
-    if st.button("🔄 Retry", use_container_width=True):
-        st.rerun()
+    # Both API calls are cached for 5 minutes, so a plain rerun would just replay the failure
+    st.button("🔄 Retry", use_container_width=True, on_click=retry_risk_data)
 
 # Bottom Navigation
 st.markdown("---")
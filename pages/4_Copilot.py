@@ -169,11 +169,9 @@ if not portfolio_loaded:
     
     col1, col2 = st.columns(2)
     with col1:
-        if st.button("🏠 Go Home", use_container_width=True, type="primary"):
-            st.switch_page("Home.py")
+        st.page_link("Home.py", label="🏠 Go Home", use_container_width=True)
     with col2:
-        if st.button("💼 Load Portfolio", use_container_width=True):
-            st.switch_page("pages/2_Portfolio.py")
+        st.page_link("pages/2_Portfolio.py", label="💼 Load Portfolio", use_container_width=True)
     st.stop()
 
 # Hero Section
@@ -374,8 +372,8 @@ with col2:
         st.rerun()
 
 with col3:
-    if st.button("🔥\n\nRisk", use_container_width=True):
-        st.switch_page("pages/3_Risk.py")
+    # Plain navigation: a page link switches pages client-side, no script rerun first
+    st.page_link("pages/3_Risk.py", label="🔥 Risk", use_container_width=True)
 
 # Still want to chat?
 with st.expander("💬 Ask a Custom Question"):
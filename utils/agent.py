@@ -2,34 +2,38 @@
 import os
 import requests
 import logging
+from utils import fast_json
 
 logger = logging.getLogger(__name__)
 
 API_BASE = os.getenv("API_BASE_URL", "https://risk-analysis-api.onrender.com")
 BEHAVIORAL_API_BASE = "https://behavioral-api.onrender.com"
 
+# One pooled session per process: repeat queries reuse keep-alive connections
+# instead of paying a new TCP/TLS handshake per request
+_session = requests.Session()
+
 def process_query(query):
     """Route query to appropriate backend endpoint"""
     
     query_lower = query.lower()
     
-    # Get portfolio from session state if available
+    # Get portfolio from session state if available (single read, one fallback)
     try:
-        import streamlit as st
-        if 'portfolio' in st.session_state:
-            symbols = st.session_state.portfolio.get('symbols', ["AAPL", "MSFT", "GOOGL"])
-            weights = st.session_state.portfolio.get('weights')
-        else:
-            symbols = ["AAPL", "MSFT", "GOOGL"]
-            weights = None
-    except:
-        symbols = ["AAPL", "MSFT", "GOOGL"]
-        weights = None
+        from utils.portfolio_manager import get_portfolio
+        symbols, weights = get_portfolio()
+    except Exception:
+        symbols, weights = [], None
+    
+    if not symbols:
+        symbols, weights = ["AAPL", "MSFT", "GOOGL"], None
+    elif not weights or len(weights) != len(symbols):
+        weights = None  # Backend applies equal weights
     
     # Risk analysis
     if any(word in query_lower for word in ['risk', 'volatility', 'var', 'loss']):
         try:
-            response = requests.post(
+            response = _session.post(
                 f"{API_BASE}/analyze",
                 json={
                     "symbols": symbols,
@@ -39,7 +43,7 @@ def process_query(query):
                 },
                 timeout=30
             )
-            data = response.json()
+            data = fast_json.loads(response.content)
             
             # DEBUG: Print the full response to see structure
             logger.info(f"API Response: {data}")
@@ -87,7 +91,7 @@ def process_query(query):
     # Optimization
     elif any(word in query_lower for word in ['optimize', 'improve', 'allocation', 'sharpe']):
         try:
-            response = requests.post(
+            response = _session.post(
                 f"{API_BASE}/optimize",
                 json={
                     "symbols": symbols,
@@ -96,7 +100,7 @@ def process_query(query):
                 },
                 timeout=30
             )
-            data = response.json()
+            data = fast_json.loads(response.content)
             
             if data.get('status') == 'success':
                 opt_weights = data.get('optimized_weights', {})
@@ -126,7 +130,7 @@ def process_query(query):
     # Stress test
     elif any(word in query_lower for word in ['stress', 'crash', 'scenario']):
         try:
-            response = requests.post(
+            response = _session.post(
                 f"{API_BASE}/stress-test",
                 json={
                     "symbols": symbols,
@@ -136,7 +140,7 @@ def process_query(query):
                 },
                 timeout=30
             )
-            data = response.json()
+            data = fast_json.loads(response.content)
             
             if data.get('status') == 'success':
                 results = data.get('stress_test_results', {})
@@ -188,7 +192,7 @@ def process_query(query):
     # Behavioral analysis
     elif any(word in query_lower for word in ['bias', 'behavioral', 'behavior', 'psychology']):
         try:
-            response = requests.post(
+            response = _session.post(
                 f"{BEHAVIORAL_API_BASE}/analyze-biases",
                 json={
                     "symbols": symbols,
@@ -196,7 +200,7 @@ def process_query(query):
                 },
                 timeout=30
             )
-            data = response.json()
+            data = fast_json.loads(response.content)
             
             if data.get('status') == 'success':
                 biases = data.get('biases_detected', [])
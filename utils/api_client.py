@@ -5,12 +5,20 @@ Thin wrapper around your existing FastAPI backend with caching support
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import logging
 import streamlit as st
 import hashlib
 import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from utils import fast_json
+from utils.risk_math import compute_health_score, health_status
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +35,13 @@ def get_api_base_url():
 # Don't call it here! Make it lazy
 # API_BASE_URL = get_api_base_url()  # ❌ DON'T DO THIS
 
+# Max number of (endpoint, payload) responses kept for ETag revalidation
+ETAG_STORE_SIZE = 128
+
+# Extra connection attempts per request; each attempt gets an equal share of the
+# caller's timeout so retries never stretch a request past the budget it asked for
+CONNECT_RETRIES = 2
+
 class APIClient:
     """Client for interacting with risk analysis backend"""
     
@@ -34,6 +49,59 @@ class APIClient:
         # Call get_api_base_url() only when creating client instance
         self.base_url = (base_url or get_api_base_url()).rstrip('/')
         self.default_timeout = 30
+        
+        # One pooled session so repeat calls (and parallel fetches) reuse keep-alive
+        # connections instead of paying a new TCP/TLS handshake each time. Only
+        # failed connects are retried (nothing was sent yet, so a POST is never
+        # duplicated); read errors and error statuses surface immediately
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=CONNECT_RETRIES,
+                connect=CONNECT_RETRIES,
+                read=0,
+                status=0,
+                backoff_factor=0.1
+            )
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
+        # (endpoint, payload hash) -> (etag, body); shared across sessions, so locked
+        self._etags: "OrderedDict[Tuple[str, str], Tuple[str, dict]]" = OrderedDict()
+        self._etag_lock = threading.Lock()
+    
+    def _get_etag(self, key: Tuple[str, str]) -> Optional[Tuple[str, dict]]:
+        """Look up a stored (etag, body) pair and mark it recently used"""
+        with self._etag_lock:
+            entry = self._etags.get(key)
+            if entry is not None:
+                self._etags.move_to_end(key)
+            return entry
+    
+    def _store_etag(self, key: Tuple[str, str], etag: str, body: dict):
+        """Remember a response body under its ETag, evicting the oldest entry when full"""
+        with self._etag_lock:
+            self._etags[key] = (etag, body)
+            self._etags.move_to_end(key)
+            while len(self._etags) > ETAG_STORE_SIZE:
+                self._etags.popitem(last=False)
+    
+    @staticmethod
+    def _request_timeout(timeout: float) -> Tuple[float, float]:
+        """
+        Split a per-request timeout into a requests (connect, read) pair
+        
+        Args:
+            timeout: Caller's timeout in seconds
+        
+        Returns:
+            (connect, read) timeouts; the connect share is divided across the
+            retried connection attempts so they all fit inside the timeout
+        """
+        return timeout / (CONNECT_RETRIES + 1), timeout
     
     def _post(self, endpoint: str, data: dict, timeout: Optional[int] = None) -> dict:
         """
@@ -46,15 +114,37 @@ class APIClient:
         
         Returns:
             Response JSON or error dict
+        
+        Note: If the backend sent an ETag for an identical earlier request, it is
+        revalidated with If-None-Match and a 304 reuses the stored body.
         """
         try:
             url = f"{self.base_url}{endpoint}"
             timeout = timeout or self.default_timeout
             logger.info(f"POST {url} (timeout={timeout}s)")
             
-            response = requests.post(url, json=data, timeout=timeout)
+            body = fast_json.dumps(data)
+            headers = {"Content-Type": "application/json"}
+            
+            etag_key = (endpoint, hashlib.sha256(body).hexdigest())
+            stored = self._get_etag(etag_key)
+            if stored is not None:
+                headers["If-None-Match"] = stored[0]
+            
+            response = self.session.post(url, data=body, headers=headers, timeout=self._request_timeout(timeout))
+            
+            if response.status_code == 304 and stored is not None:
+                logger.info(f"304 Not Modified for {endpoint}, reusing stored response")
+                return stored[1]
+            
             response.raise_for_status()
-            return response.json()
+            result = fast_json.loads(response.content)
+            
+            etag = response.headers.get("ETag")
+            if etag:
+                self._store_etag(etag_key, etag, result)
+            
+            return result
             
         except requests.exceptions.Timeout:
             logger.error(f"Request timeout for {endpoint} after {timeout}s")
@@ -62,29 +152,27 @@ class APIClient:
         except requests.exceptions.RequestException as e:
             logger.error(f"Request failed for {endpoint}: {e}")
             return {"error": f"Request failed: {str(e)}"}
+        except ValueError as e:
+            logger.error(f"Invalid JSON from {endpoint}: {e}")
+            return {"error": f"Invalid response from server: {str(e)}"}
     
     # ==================== CACHED API CALLS ====================
     
     @st.cache_data(ttl=300, show_spinner=False)
-    def get_portfolio_health(_self, symbols_tuple: Tuple[str, ...], weights_tuple: Optional[Tuple[float, ...]] = None) -> dict:
+    def get_portfolio_health(_self, symbols_tuple: Tuple[str, ...], weights_tuple: Optional[Tuple[float, ...]] = None, _timeout: Optional[int] = None) -> dict:
         """
         Get overall portfolio health score (cached for 5 minutes)
         
-        Note: Uses tuples for hashability in Streamlit cache
+        Note: Uses tuples for hashability in Streamlit cache. The score is derived
+        from get_risk_analysis() so both share a single /analyze request.
+        _timeout is excluded from the cache key, so callers with different
+        timeouts still share one cache entry.
         """
-        symbols = list(symbols_tuple)
-        weights = list(weights_tuple) if weights_tuple else None
-        
-        if not symbols:
+        if not symbols_tuple:
             return {"score": 0, "status": "No portfolio data"}
         
-        # Get risk analysis
-        risk_data = _self._post("/analyze", {
-            "symbols": symbols,
-            "weights": weights,
-            "period": "1year",
-            "use_real_data": True
-        })
+        # Reuse the cached /analyze response instead of issuing the same POST twice
+        risk_data = _self.get_risk_analysis(symbols_tuple, weights_tuple, _timeout=_timeout)
         
         if "error" in risk_data:
             return {"score": 50, "status": "Unable to calculate"}
@@ -96,24 +184,22 @@ class APIClient:
         volatility = metrics.get('annualized_volatility', 0.25)
         sharpe = metrics.get('sharpe_ratio', 0)
         
-        vol_score = max(0, 100 - (volatility * 200))
-        sharpe_score = min(50, sharpe * 25)
-        
-        score = int(vol_score + sharpe_score)
+        score = compute_health_score(volatility, sharpe)
         
         return {
             "score": score,
             "volatility": volatility,
             "sharpe_ratio": sharpe,
-            "status": "healthy" if score >= 80 else "caution" if score >= 60 else "risk"
+            "status": health_status(score)
         }
     
     @st.cache_data(ttl=300, show_spinner=False)
-    def get_risk_analysis(_self, symbols_tuple: Tuple[str, ...], weights_tuple: Optional[Tuple[float, ...]] = None, period: str = "1year") -> dict:
+    def get_risk_analysis(_self, symbols_tuple: Tuple[str, ...], weights_tuple: Optional[Tuple[float, ...]] = None, period: str = "1year", _timeout: Optional[int] = None) -> dict:
         """
         Get comprehensive risk analysis (cached for 5 minutes)
         
-        Note: Uses tuples for hashability in Streamlit cache
+        Note: Uses tuples for hashability in Streamlit cache. _timeout (seconds,
+        default_timeout if None) is excluded from the cache key.
         """
         symbols = list(symbols_tuple)
         weights = list(weights_tuple) if weights_tuple else None
@@ -123,7 +209,7 @@ class APIClient:
             "weights": weights,
             "period": period,
             "use_real_data": True
-        })
+        }, timeout=_timeout)
     
     @st.cache_data(ttl=300, show_spinner=False)
     def get_risk_attribution(_self, symbols_tuple: Tuple[str, ...], weights_tuple: Optional[Tuple[float, ...]] = None, period: str = "1year") -> dict:
@@ -286,9 +372,9 @@ class APIClient:
         """Get default hedge candidate universe (cached for 1 hour)"""
         try:
             url = f"{_self.base_url}/hedging/default-candidates"
-            response = requests.get(url, timeout=timeout)
+            response = _self.session.get(url, timeout=_self._request_timeout(timeout))
             response.raise_for_status()
-            return response.json()
+            return fast_json.loads(response.content)
         except Exception as e:
             logger.error(f"Failed to get hedge candidates: {e}")
             # Fallback to default candidates
@@ -303,19 +389,47 @@ class APIClient:
                 }
             }
 
-# Singleton instance
-_client = None
-
+@st.cache_resource(show_spinner=False)
 def get_api_client() -> APIClient:
-    """Get or create API client instance"""
-    global _client
-    if _client is None:
-        _client = APIClient()
-    return _client
+    """Get the shared API client instance (one per process, reused across reruns and sessions)"""
+    return APIClient()
+
+def fetch_concurrently(*calls: Callable[[], Any]) -> List[Any]:
+    """
+    Run independent (network-bound) calls in parallel threads
+    
+    Worker threads are attached to the current script run, so cached functions
+    and st.session_state reads behave as they would in the main thread.
+    
+    Args:
+        *calls: Zero-argument callables, e.g. lambda: client.get_risk_analysis(s, w)
+    
+    Returns:
+        Results in the same order as calls (exceptions are re-raised)
+    """
+    if not calls:
+        return []
+    
+    ctx = get_script_run_ctx()
+    
+    with ThreadPoolExecutor(
+        max_workers=len(calls),
+        initializer=add_script_run_ctx,
+        initargs=(None, ctx)
+    ) as executor:
+        futures = [executor.submit(call) for call in calls]
+        return [future.result() for future in futures]
+
+# Session-state keys with this prefix hold per-session memos of cached API results
+SESSION_MEMO_PREFIX = "_memo_"
 
 def clear_all_caches():
     """Clear all Streamlit caches - useful for manual refresh"""
     st.cache_data.clear()
+    
+    # Drop per-session memos so the next run goes back to the (now empty) caches
+    for key in [k for k in st.session_state if str(k).startswith(SESSION_MEMO_PREFIX)]:
+        del st.session_state[key]
 
 # Convenience functions with proper tuple conversion
 def get_portfolio_health(symbols: List[str] = None, weights: List[float] = None) -> dict:
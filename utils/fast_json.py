@@ -0,0 +1,39 @@
+# utils/fast_json.py
+"""
+JSON encode/decode helpers - uses orjson when installed, stdlib json otherwise
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+def loads(content):
+    """
+    Parse JSON from bytes or str
+
+    Args:
+        content: Raw JSON payload (e.g. response.content)
+
+    Returns:
+        Decoded Python object
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def dumps(obj) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON bytes
+
+    Args:
+        obj: JSON-serializable object (NumPy scalars/arrays allowed with orjson)
+
+    Returns:
+        Encoded JSON bytes, ready to send as a request body
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj).encode("utf-8")
@@ -88,9 +88,7 @@ def show_hedge_preview_dialog(
             
             if 'error' in hedge_eval:
                 st.error(f"Unable to evaluate hedge: {hedge_eval['error']}")
-                if st.button("Close", key=f"{preview_key}_close_error"):
-                    st.session_state[f"{preview_key}_active"] = False
-                    st.rerun()
+                st.button("Close", key=f"{preview_key}_close_error", on_click=close_hedge_preview, args=(hedge_symbol,))
                 return True, False
             
             # Extract metrics
@@ -278,24 +276,21 @@ def show_hedge_preview_dialog(
             
             # New allocation breakdown
             with st.expander("📋 New Portfolio Allocation"):
-                st.markdown("**After adding hedge:**")
-                
                 # Calculate new weights
                 scale_factor = 1 - hedge_weight
-                new_allocations = []
-                
-                for symbol, weight in zip(current_symbols, current_weights):
-                    new_weight = weight * scale_factor
-                    new_allocations.append((symbol, new_weight))
-                
+                new_allocations = [(symbol, weight * scale_factor) for symbol, weight in zip(current_symbols, current_weights)]
                 new_allocations.append((hedge_symbol, hedge_weight))
                 
-                for symbol, weight in new_allocations:
-                    col1, col2 = st.columns([3, 1])
-                    with col1:
-                        st.write(f"**{symbol}**")
-                    with col2:
-                        st.write(f"{weight*100:.1f}%")
+                # One markdown table instead of 2 columns + 2 writes per holding
+                allocation_rows = "\n".join(
+                    f"| **{symbol}** | {weight*100:.1f}% |" for symbol, weight in new_allocations
+                )
+                st.markdown(
+                    "**After adding hedge:**\n\n"
+                    "| Holding | Weight |\n"
+                    "|:--|--:|\n"
+                    f"{allocation_rows}"
+                )
             
             # Action buttons
             st.markdown("---")
@@ -303,9 +298,13 @@ def show_hedge_preview_dialog(
             col1, col2 = st.columns(2)
             
             with col1:
-                if st.button("❌ Cancel", key=f"{preview_key}_cancel", use_container_width=True):
-                    st.session_state[f"{preview_key}_active"] = False
-                    st.rerun()
+                st.button(
+                    "❌ Cancel",
+                    key=f"{preview_key}_cancel",
+                    use_container_width=True,
+                    on_click=close_hedge_preview,
+                    args=(hedge_symbol,)
+                )
             
             with col2:
                 if st.button(f"✅ Add {hedge_symbol}", key=f"{preview_key}_confirm", use_container_width=True, type="primary"):
@@ -317,9 +316,7 @@ def show_hedge_preview_dialog(
             
     except Exception as e:
         st.error(f"Unable to calculate hedge impact: {str(e)}")
-        if st.button("Close", key=f"{preview_key}_close"):
-            st.session_state[f"{preview_key}_active"] = False
-            st.rerun()
+        st.button("Close", key=f"{preview_key}_close", on_click=close_hedge_preview, args=(hedge_symbol,))
         return True, False
 
 def activate_hedge_preview(hedge_symbol: str):
@@ -327,6 +324,16 @@ def activate_hedge_preview(hedge_symbol: str):
     preview_key = f"hedge_preview_{hedge_symbol}"
     st.session_state[f"{preview_key}_active"] = True
 
+def close_hedge_preview(hedge_symbol: str):
+    """
+    Close the hedge preview for a specific symbol
+    
+    Used as a button callback, so the click's own rerun (scoped to the calling
+    fragment, if any) redraws without the preview - no explicit st.rerun()
+    """
+    preview_key = f"hedge_preview_{hedge_symbol}"
+    st.session_state[f"{preview_key}_active"] = False
+
 def is_hedge_confirmed(hedge_symbol: str) -> bool:
     """Check if hedge was confirmed and clear the flag"""
     preview_key = f"hedge_preview_{hedge_symbol}"
@@ -6,21 +6,21 @@ Generate portfolio insights from risk analysis data
 from typing import List, Dict, Optional
 import streamlit as st
 
-@st.cache_data(ttl=300, show_spinner=False)
 def generate_insights(symbols: tuple, weights: tuple, risk_data: dict) -> List[Dict]:
     """
     Generate actionable insights from portfolio risk data
     
     Args:
-        symbols: Tuple of portfolio symbols (for caching)
-        weights: Tuple of portfolio weights (for caching)
+        symbols: Tuple of portfolio symbols
+        weights: Tuple of portfolio weights
         risk_data: Risk analysis response from API
     
     Returns:
         List of insight dictionaries with title, description, emoji, and actions
-    """
-    insights = []
     
+    Note: Only the handful of scalars the rules read are passed to the cached
+    builder, so a cache probe doesn't hash the whole risk_data response.
+    """
     # Handle error case
     if not risk_data or 'error' in risk_data:
         return [{
@@ -41,11 +41,24 @@ def generate_insights(symbols: tuple, weights: tuple, risk_data: dict) -> List[D
             'priority': 'low'
         }]
     
-    volatility = metrics.get('annualized_volatility', 0)
-    sharpe = metrics.get('sharpe_ratio', 0)
-    var_95 = metrics.get('var_95', 0)
-    cvar_95 = metrics.get('cvar_95', 0)
-    max_drawdown = metrics.get('max_drawdown', 0)
+    return _insights_from_metrics(
+        len(symbols),
+        metrics.get('annualized_volatility', 0),
+        metrics.get('sharpe_ratio', 0),
+        metrics.get('cvar_95', 0),
+        metrics.get('max_drawdown', 0)
+    )
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _insights_from_metrics(
+    holdings_count: int,
+    volatility: float,
+    sharpe: float,
+    cvar_95: float,
+    max_drawdown: float
+) -> List[Dict]:
+    """Apply the insight rules to extracted metrics (cached on the scalars)"""
+    insights = []
     
     # Insight 1: Volatility Assessment
     if volatility > 0.30:  # High volatility (>30%)
@@ -155,24 +168,23 @@ def generate_insights(symbols: tuple, weights: tuple, risk_data: dict) -> List[D
         })
     
     # Insight 5: Concentration Risk
-    symbols_list = list(symbols)
-    if len(symbols_list) < 5:
+    if holdings_count < 5:
         insights.append({
             'emoji': '⚠️',
             'title': 'Concentrated Portfolio',
-            'description': f'Only {len(symbols_list)} holdings. Consider adding 5-10 more for better diversification.',
+            'description': f'Only {holdings_count} holdings. Consider adding 5-10 more for better diversification.',
             'priority': 'medium',
             'metric': 'concentration',
-            'value': len(symbols_list)
+            'value': holdings_count
         })
-    elif len(symbols_list) > 20:
+    elif holdings_count > 20:
         insights.append({
             'emoji': '📊',
             'title': 'Highly Diversified',
-            'description': f'{len(symbols_list)} holdings may be too many to manage effectively. Consider consolidation.',
+            'description': f'{holdings_count} holdings may be too many to manage effectively. Consider consolidation.',
             'priority': 'low',
             'metric': 'concentration',
-            'value': len(symbols_list)
+            'value': holdings_count
         })
     
     # Sort by priority
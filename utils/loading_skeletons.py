@@ -6,6 +6,92 @@ Shows structure while data is loading instead of blank screens
 
 import streamlit as st
 
+# Static skeleton markup, built once at import time and reused on every rerun
+SHIMMER_KEYFRAMES = """
+<style>
+    @keyframes shimmer {
+        0% { background-position: -200% 0; }
+        100% { background-position: 200% 0; }
+    }
+</style>
+"""
+
+INSIGHT_CARD_SKELETON_HTML = """
+<div style="
+    background: #ffffff;
+    border: 1px solid #e0e2e6;
+    border-radius: 0.75rem;
+    padding: 1.25rem;
+    margin: 0.75rem 0;
+">
+    <div style="
+        background: linear-gradient(90deg, #f0f2f6 25%, #e0e2e6 50%, #f0f2f6 75%);
+        background-size: 200% 100%;
+        animation: shimmer 1.5s infinite;
+        height: 1rem;
+        width: 70%;
+        margin-bottom: 0.75rem;
+        border-radius: 0.25rem;
+    "></div>
+    <div style="
+        background: linear-gradient(90deg, #f0f2f6 25%, #e0e2e6 50%, #f0f2f6 75%);
+        background-size: 200% 100%;
+        animation: shimmer 1.5s infinite;
+        height: 0.75rem;
+        width: 90%;
+        margin-bottom: 0.5rem;
+        border-radius: 0.25rem;
+    "></div>
+    <div style="
+        background: linear-gradient(90deg, #f0f2f6 25%, #e0e2e6 50%, #f0f2f6 75%);
+        background-size: 200% 100%;
+        animation: shimmer 1.5s infinite;
+        height: 0.75rem;
+        width: 80%;
+        border-radius: 0.25rem;
+    "></div>
+</div>
+"""
+
+SCENARIO_CARD_SKELETON_HTML = """
+<div style="
+    background: #ffffff;
+    border: 2px solid #e0e2e6;
+    border-radius: 1rem;
+    padding: 1rem;
+    text-align: center;
+    margin: 0.5rem 0;
+">
+    <div style="
+        background: linear-gradient(90deg, #f0f2f6 25%, #e0e2e6 50%, #f0f2f6 75%);
+        background-size: 200% 100%;
+        animation: shimmer 1.5s infinite;
+        height: 2.5rem;
+        width: 2.5rem;
+        border-radius: 50%;
+        margin: 0 auto 0.75rem auto;
+    "></div>
+    <div style="
+        background: linear-gradient(90deg, #f0f2f6 25%, #e0e2e6 50%, #f0f2f6 75%);
+        background-size: 200% 100%;
+        animation: shimmer 1.5s infinite;
+        height: 1rem;
+        width: 80%;
+        margin: 0.5rem auto;
+        border-radius: 0.25rem;
+    "></div>
+    <div style="
+        background: linear-gradient(90deg, #f0f2f6 25%, #e0e2e6 50%, #f0f2f6 75%);
+        background-size: 200% 100%;
+        animation: shimmer 1.5s infinite;
+        height: 1.5rem;
+        width: 60%;
+        margin: 0.5rem auto;
+        border-radius: 0.25rem;
+    "></div>
+</div>
+""" + SHIMMER_KEYFRAMES
+
 def show_metric_skeleton(label: str = "Loading..."):
     """Show skeleton for a metric card"""
     st.markdown(f"""
@@ -89,13 +175,7 @@ def show_risk_score_skeleton():
             border-radius: 0.25rem;
         "></div>
     </div>
-    <style>
-        @keyframes shimmer {{
-            0% {{ background-position: -200% 0; }}
-            100% {{ background-position: 200% 0; }}
-        }}
-    </style>
-    """, unsafe_allow_html=True)
+    """ + SHIMMER_KEYFRAMES, unsafe_allow_html=True)
 
 def show_chart_skeleton(height: int = 400):
     """Show skeleton for chart area"""
@@ -117,61 +197,12 @@ def show_chart_skeleton(height: int = 400):
     """, unsafe_allow_html=True)
 
 def show_insight_card_skeleton(count: int = 3):
-    """Show skeleton for insight cards"""
-    for i in range(count):
-        st.markdown(f"""
-        <div style="
-            background: #ffffff;
-            border: 1px solid #e0e2e6;
-            border-radius: 0.75rem;
-            padding: 1.25rem;
-            margin: 0.75rem 0;
-        ">
-            <div style="
-                background: linear-gradient(90deg, #f0f2f6 25%, #e0e2e6 50%, #f0f2f6 75%);
-                background-size: 200% 100%;
-                animation: shimmer 1.5s infinite;
-                height: 1rem;
-                width: 70%;
-                margin-bottom: 0.75rem;
-                border-radius: 0.25rem;
-            "></div>
-            <div style="
-                background: linear-gradient(90deg, #f0f2f6 25%, #e0e2e6 50%, #f0f2f6 75%);
-                background-size: 200% 100%;
-                animation: shimmer 1.5s infinite;
-                height: 0.75rem;
-                width: 90%;
-                margin-bottom: 0.5rem;
-                border-radius: 0.25rem;
-            "></div>
-            <div style="
-                background: linear-gradient(90deg, #f0f2f6 25%, #e0e2e6 50%, #f0f2f6 75%);
-                background-size: 200% 100%;
-                animation: shimmer 1.5s infinite;
-                height: 0.75rem;
-                width: 80%;
-                border-radius: 0.25rem;
-            "></div>
-        </div>
-        <style>
-            @keyframes shimmer {{
-                0% {{ background-position: -200% 0; }}
-                100% {{ background-position: 200% 0; }}
-            }}
-        </style>
-        """, unsafe_allow_html=True)
+    """Show skeleton for insight cards (all cards in a single markdown element)"""
+    st.markdown(INSIGHT_CARD_SKELETON_HTML * count + SHIMMER_KEYFRAMES, unsafe_allow_html=True)
 
 def show_table_skeleton(rows: int = 5):
     """Show skeleton for data table"""
-    st.markdown("""
-    <style>
-        @keyframes shimmer {
-            0% { background-position: -200% 0; }
-            100% { background-position: 200% 0; }
-        }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(SHIMMER_KEYFRAMES, unsafe_allow_html=True)
     
     for i in range(rows):
         cols = st.columns([2, 1, 1, 1])
@@ -204,52 +235,9 @@ def show_scenario_cards_skeleton(count: int = 4):
     """Show skeleton for stress scenario cards"""
     cols = st.columns(min(count, 4))
     
-    for i, col in enumerate(cols):
+    for col in cols:
         with col:
-            st.markdown(f"""
-            <div style="
-                background: #ffffff;
-                border: 2px solid #e0e2e6;
-                border-radius: 1rem;
-                padding: 1rem;
-                text-align: center;
-                margin: 0.5rem 0;
-            ">
-                <div style="
-                    background: linear-gradient(90deg, #f0f2f6 25%, #e0e2e6 50%, #f0f2f6 75%);
-                    background-size: 200% 100%;
-                    animation: shimmer 1.5s infinite;
-                    height: 2.5rem;
-                    width: 2.5rem;
-                    border-radius: 50%;
-                    margin: 0 auto 0.75rem auto;
-                "></div>
-                <div style="
-                    background: linear-gradient(90deg, #f0f2f6 25%, #e0e2e6 50%, #f0f2f6 75%);
-                    background-size: 200% 100%;
-                    animation: shimmer 1.5s infinite;
-                    height: 1rem;
-                    width: 80%;
-                    margin: 0.5rem auto;
-                    border-radius: 0.25rem;
-                "></div>
-                <div style="
-                    background: linear-gradient(90deg, #f0f2f6 25%, #e0e2e6 50%, #f0f2f6 75%);
-                    background-size: 200% 100%;
-                    animation: shimmer 1.5s infinite;
-                    height: 1.5rem;
-                    width: 60%;
-                    margin: 0.5rem auto;
-                    border-radius: 0.25rem;
-                "></div>
-            </div>
-            <style>
-                @keyframes shimmer {{
-                    0% {{ background-position: -200% 0; }}
-                    100% {{ background-position: 200% 0; }}
-                }}
-            </style>
-            """, unsafe_allow_html=True)
+            st.markdown(SCENARIO_CARD_SKELETON_HTML, unsafe_allow_html=True)
 
 def show_loading_message(message: str = "Loading...", emoji: str = "⏳"):
     """Show a friendly loading message"""
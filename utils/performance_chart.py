@@ -12,6 +12,8 @@ from datetime import datetime, timedelta
 from typing import List, Tuple, Dict
 import yfinance as yf
 
+# Annualization factor for daily returns (252 trading days)
+SQRT_TRADING_DAYS = np.sqrt(252)
 
 def get_historical_prices(symbols: List[str], period: str = "1y") -> Dict:
     """
@@ -174,10 +176,10 @@ def show_performance_chart(symbols: List[str], weights: List[float], period: str
     
     # Calculate volatility (annualized)
     portfolio_returns = np.diff(portfolio_values) / portfolio_values[:-1]
-    portfolio_volatility = np.std(portfolio_returns) * np.sqrt(252) * 100
+    portfolio_volatility = np.std(portfolio_returns) * SQRT_TRADING_DAYS * 100
     
     spy_returns = np.diff(spy_values) / spy_values[:-1]
-    spy_volatility = np.std(spy_returns) * np.sqrt(252) * 100
+    spy_volatility = np.std(spy_returns) * SQRT_TRADING_DAYS * 100
     
     # Create figure with subplots
     fig = make_subplots(
@@ -6,6 +6,9 @@ Portfolio state management for Streamlit session
 import streamlit as st
 from typing import List, Tuple, Optional
 
+# Session-state slot for the hashable (symbols, weights) tuples of the current portfolio
+PORTFOLIO_KEY_STATE = "_portfolio_key"
+
 def initialize_portfolio():
     """Initialize portfolio in session state with default values"""
     if 'portfolio_symbols' not in st.session_state:
@@ -27,6 +30,25 @@ def get_portfolio() -> Tuple[List[str], List[float]]:
     
     return symbols, weights
 
+def get_portfolio_key() -> Tuple[Tuple[str, ...], Tuple[float, ...]]:
+    """
+    Get the current portfolio as hashable tuples for cached API calls
+    
+    Built once per portfolio change and reused across reruns, so callers don't
+    rebuild the tuples (and their cache fingerprints see the same objects).
+    
+    Returns:
+        Tuple of (symbols_tuple, weights_tuple)
+    """
+    key = st.session_state.get(PORTFOLIO_KEY_STATE)
+    
+    if key is None:
+        symbols, weights = get_portfolio()
+        key = (tuple(symbols), tuple(weights))
+        st.session_state[PORTFOLIO_KEY_STATE] = key
+    
+    return key
+
 def set_portfolio(symbols: List[str], weights: Optional[List[float]] = None):
     """
     Set portfolio in session state
@@ -49,6 +71,7 @@ def set_portfolio(symbols: List[str], weights: Optional[List[float]] = None):
     
     st.session_state.portfolio_symbols = symbols
     st.session_state.portfolio_weights = weights
+    st.session_state.pop(PORTFOLIO_KEY_STATE, None)
 
 def add_to_portfolio(symbol: str, weight: float = 0.1):
     """
@@ -121,6 +144,7 @@ def clear_portfolio():
     """Clear the entire portfolio"""
     st.session_state.portfolio_symbols = []
     st.session_state.portfolio_weights = []
+    st.session_state.pop(PORTFOLIO_KEY_STATE, None)
 
 def get_portfolio_size() -> int:
     """Get number of holdings in portfolio"""
@@ -5,9 +5,11 @@ Calculate real portfolio values based on current prices
 
 import streamlit as st
 import requests
+import numpy as np
 from typing import Dict, List, Optional, Tuple
 import os
 import logging
+from utils import fast_json
 
 logger = logging.getLogger(__name__)
 
@@ -24,55 +26,71 @@ def get_fmp_api_key():
 FMP_API_KEY = get_fmp_api_key()
 FMP_BASE_URL = "https://financialmodelingprep.com/api/v3"
 
-@st.cache_data(ttl=60, show_spinner=False)  # Cache prices for 1 minute
-def get_current_prices(symbols_tuple: Tuple[str, ...]) -> Dict[str, float]:
+# Shared across quote fetches so FMP requests reuse keep-alive connections
+_fmp_session = requests.Session()
+
+@st.cache_data(ttl=60, show_spinner=False)  # Cache quotes for 1 minute
+def get_quotes(symbols_tuple: Tuple[str, ...]) -> Dict[str, dict]:
     """
-    Fetch current prices for a list of symbols
+    Fetch full FMP quotes for all symbols in a single batched request
     
     Args:
         symbols_tuple: Tuple of stock symbols (tuple for caching)
     
     Returns:
-        Dictionary mapping symbol to current price
+        Dictionary mapping symbol to its raw quote (empty if unavailable)
     """
-    symbols = list(symbols_tuple)
     api_key = get_fmp_api_key()  # Get fresh key each time
     
-    if not api_key:
-        logger.warning("FMP_API_KEY not set, using mock prices")
-        # Return mock prices for testing
-        return {symbol: 100.0 + (hash(symbol) % 500) for symbol in symbols}
+    if not api_key or not symbols_tuple:
+        return {}
     
     try:
-        # Batch fetch current prices from FMP
-        symbols_str = ",".join(symbols)
+        # One request for every symbol instead of one per symbol
+        symbols_str = ",".join(symbols_tuple)
         url = f"{FMP_BASE_URL}/quote/{symbols_str}"
         params = {"apikey": api_key}
         
-        response = requests.get(url, params=params, timeout=10)
+        response = _fmp_session.get(url, params=params, timeout=10)
         response.raise_for_status()
-        data = response.json()
-        
-        # Extract prices
-        prices = {}
-        for item in data:
-            symbol = item.get('symbol')
-            price = item.get('price', 0)
-            if symbol and price:
-                prices[symbol] = float(price)
-        
-        # Fill in missing prices with fallback
-        for symbol in symbols:
-            if symbol not in prices:
-                logger.warning(f"Price not found for {symbol}, using fallback")
-                prices[symbol] = 100.0
         
-        return prices
+        return {item['symbol']: item for item in fast_json.loads(response.content) if item.get('symbol')}
         
     except Exception as e:
-        logger.error(f"Failed to fetch prices: {e}")
-        # Return fallback prices
-        return {symbol: 100.0 for symbol in symbols}
+        logger.error(f"Failed to fetch quotes: {e}")
+        return {}
+
+@st.cache_data(ttl=60, show_spinner=False)  # Cache prices for 1 minute
+def get_current_prices(symbols_tuple: Tuple[str, ...]) -> Dict[str, float]:
+    """
+    Fetch current prices for a list of symbols
+    
+    Args:
+        symbols_tuple: Tuple of stock symbols (tuple for caching)
+    
+    Returns:
+        Dictionary mapping symbol to current price
+    """
+    symbols = list(symbols_tuple)
+    
+    if not get_fmp_api_key():
+        logger.warning("FMP_API_KEY not set, using mock prices")
+        # Return mock prices for testing
+        return {symbol: 100.0 + (hash(symbol) % 500) for symbol in symbols}
+    
+    quotes = get_quotes(symbols_tuple)
+    
+    # Extract prices, filling in missing ones with fallback
+    prices = {}
+    for symbol in symbols:
+        price = quotes.get(symbol, {}).get('price', 0)
+        if price:
+            prices[symbol] = float(price)
+        else:
+            logger.warning(f"Price not found for {symbol}, using fallback")
+            prices[symbol] = 100.0
+    
+    return prices
 
 def calculate_portfolio_value(
     symbols: List[str],
@@ -100,31 +118,30 @@ def calculate_portfolio_value(
     # Get current prices
     prices = get_current_prices(tuple(symbols))
     
-    # Calculate holdings
-    holdings = []
-    total_value = 0.0
+    # Calculate holdings for all symbols at once
+    weights_arr = np.asarray(weights, dtype=float)
+    price_arr = np.array([prices.get(symbol, 0) for symbol in symbols], dtype=float)
     
-    for symbol, weight in zip(symbols, weights):
-        allocation = total_investment * weight
-        price = prices.get(symbol, 0)
-        
-        if price > 0:
-            shares = allocation / price
-            current_value = shares * price
-        else:
-            shares = 0
-            current_value = 0
-        
-        holdings.append({
+    allocations = total_investment * weights_arr
+    shares = np.divide(allocations, price_arr, out=np.zeros_like(allocations), where=price_arr > 0)
+    current_values = shares * price_arr
+    
+    total_value = float(current_values.sum())
+    
+    holdings = [
+        {
             "symbol": symbol,
             "weight": weight,
             "allocation": allocation,
             "price": price,
-            "shares": shares,
+            "shares": share_count,
             "current_value": current_value
-        })
-        
-        total_value += current_value
+        }
+        for symbol, weight, allocation, price, share_count, current_value in zip(
+            symbols, weights, allocations.tolist(), price_arr.tolist(),
+            shares.tolist(), current_values.tolist()
+        )
+    ]
     
     return {
         "total_value": total_value,
@@ -162,7 +179,22 @@ def get_portfolio_stats(symbols: List[str], weights: List[float]) -> Dict:
     # Get portfolio value from session state or use default
     total_investment = st.session_state.get('portfolio_investment', 100000.0)
     
-    portfolio_data = calculate_portfolio_value(symbols, weights, total_investment)
+    return _cached_portfolio_stats(tuple(symbols), tuple(weights), total_investment)
+
+@st.cache_data(ttl=60, show_spinner=False)  # Same lifetime as the prices it is built from
+def _cached_portfolio_stats(
+    symbols_tuple: Tuple[str, ...],
+    weights_tuple: Tuple[float, ...],
+    total_investment: float
+) -> Dict:
+    """Build portfolio stats (cached on the portfolio and investment amount)"""
+    symbols = list(symbols_tuple)
+    
+    portfolio_data = calculate_portfolio_value(symbols, list(weights_tuple), total_investment)
+    
+    # Format per-holding values once here so cache hits hand pages ready-made strings
+    for holding in portfolio_data["holdings"]:
+        holding["current_value_formatted"] = format_currency(holding["current_value"])
     
     return {
         "total_value": portfolio_data["total_value"],
@@ -194,24 +226,9 @@ def get_price_change_24h(symbol: str) -> Optional[float]:
     Returns:
         Percentage change or None if unavailable
     """
-    api_key = get_fmp_api_key()
+    quote = get_quotes((symbol,)).get(symbol)
     
-    if not api_key:
+    if quote is None:
         return None
     
-    try:
-        url = f"{FMP_BASE_URL}/quote/{symbol}"
-        params = {"apikey": api_key}
-        
-        response = requests.get(url, params=params, timeout=5)
-        response.raise_for_status()
-        data = response.json()
-        
-        if data and len(data) > 0:
-            return data[0].get('changesPercentage', 0)
-        
-        return None
-        
-    except Exception as e:
-        logger.error(f"Failed to fetch 24h change for {symbol}: {e}")
-        return None
\ No newline at end of file
+    return quote.get('changesPercentage', 0)
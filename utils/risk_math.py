@@ -0,0 +1,89 @@
+# utils/risk_math.py
+"""
+Portfolio health score and stress-test math shared by the API client and pages
+"""
+
+import bisect
+from typing import Dict, List, Tuple
+import numpy as np
+
+# Health score band floors (ascending); band index 0 = risk, 1 = caution, 2 = healthy
+HEALTH_BANDS = (60, 80)
+HEALTH_STATUSES = ("risk", "caution", "healthy")
+
+def compute_health_score(volatility: float, sharpe: float) -> int:
+    """
+    Calculate the 0-100+ portfolio health score
+
+    Args:
+        volatility: Annualized volatility (e.g. 0.25 for 25%)
+        sharpe: Sharpe ratio
+
+    Returns:
+        Health score (higher is healthier)
+    """
+    vol_score = max(0, 100 - (volatility * 200))
+    sharpe_score = min(50, sharpe * 25)
+
+    return int(vol_score + sharpe_score)
+
+def compute_health_scores(volatilities, sharpes) -> np.ndarray:
+    """
+    Vectorized compute_health_score() for comparing many portfolios at once
+
+    Args:
+        volatilities: Array-like of annualized volatilities
+        sharpes: Array-like of Sharpe ratios
+
+    Returns:
+        Integer array of health scores
+    """
+    vol_scores = np.maximum(0, 100 - np.asarray(volatilities, dtype=float) * 200)
+    sharpe_scores = np.minimum(50, np.asarray(sharpes, dtype=float) * 25)
+
+    # Truncate toward zero to match int() in the scalar version
+    return np.trunc(vol_scores + sharpe_scores).astype(np.int64)
+
+def health_band(score: float) -> int:
+    """Index of the health band a score falls in (a score on a floor belongs to that band)"""
+    return bisect.bisect_right(HEALTH_BANDS, score)
+
+def health_status(score: int) -> str:
+    """Map a health score to its status label"""
+    return HEALTH_STATUSES[health_band(score)]
+
+def rank_stress_scenarios(scenarios: Dict) -> Tuple[List[dict], float]:
+    """
+    Normalize stress-test losses to percentages and rank them worst first
+    
+    Args:
+        scenarios: Backend stress_scenarios mapping of name -> result dict
+            (with total_loss_pct) or a bare loss number
+    
+    Returns:
+        Tuple of (scenario rows sorted by loss descending, mean loss);
+        each row is {'name': display name, 'loss': loss in percent}
+    """
+    names = list(scenarios)
+    raw = [
+        (data.get('total_loss_pct') or 0) if isinstance(data, dict)
+        else data if isinstance(data, (int, float))
+        else 0
+        for data in scenarios.values()
+    ]
+    
+    losses = np.abs(np.fromiter(raw, dtype=np.float64, count=len(raw)))
+    
+    # Backend mixes fractions (0.37) and percents (37.0); fractions get scaled up
+    losses = np.where((losses > 0) & (losses < 1), losses * 100, losses)
+    
+    # Stable, so tied scenarios keep the backend's order
+    order = np.argsort(-losses, kind="stable")
+    
+    rows = [
+        {'name': names[i].replace('_', ' ').title(), 'loss': loss}
+        for i, loss in zip(order.tolist(), losses[order].tolist())
+    ]
+    avg_loss = float(losses.mean()) if len(rows) else 0.0
+    
+    return rows, avg_loss
@@ -5,11 +5,14 @@ Shows detailed historical context, portfolio impact, and lessons learned
 """
 
 import streamlit as st
-import plotly.graph_objects as go
 from utils.scenario_data import get_scenario_detail, estimate_portfolio_impact
+from utils.styles import inject_css
 from typing import List
 import numpy as np
 
+# Loss % bands for impact bars: <=25 amber, <=40 orange, >40 red
+IMPACT_THRESHOLDS = np.array([25.0, 40.0])
+IMPACT_COLORS = np.array(["#fbbf24", "#f97316", "#ef4444"])
 
 def show_scenario_modal(scenario_name: str, portfolio_symbols: List[str], portfolio_weights: List[float]):
     """
@@ -21,6 +24,10 @@ def show_scenario_modal(scenario_name: str, portfolio_symbols: List[str], portfo
         portfolio_weights: List of weights for each symbol
     """
     
+    # Imported here so the Risk page's main view (which only needs the
+    # activate/is-active helpers below) never pays plotly's import cost
+    import plotly.graph_objects as go
+    
     # Get scenario details from database
     detail = get_scenario_detail(scenario_name)
     
@@ -31,95 +38,18 @@ def show_scenario_modal(scenario_name: str, portfolio_symbols: List[str], portfo
         portfolio_weights
     )
     
-    # Modal container with enhanced styling
+    # Static modal styles (read once per process) + this scenario's accent color
+    inject_css("scenario_modal.css")
+    
     st.markdown(f"""
     <style>
-        .scenario-modal {{
-            background: white;
-            border-radius: 20px;
-            padding: 0;
-            margin: 1rem 0;
-            box-shadow: 0 20px 60px rgba(0,0,0,0.3);
-            overflow: hidden;
-        }}
-        
         .modal-header {{
             background: linear-gradient(135deg, {detail.color} 0%, {detail.color}dd 100%);
-            color: white;
-            padding: 2rem 1.5rem;
-            position: relative;
-        }}
-        
-        .modal-icon {{
-            font-size: 4rem;
-            margin-bottom: 0.5rem;
-            text-shadow: 0 2px 10px rgba(0,0,0,0.2);
-        }}
-        
-        .modal-title {{
-            font-size: 1.75rem;
-            font-weight: bold;
-            margin-bottom: 0.5rem;
-        }}
-        
-        .modal-subtitle {{
-            font-size: 1rem;
-            opacity: 0.95;
-        }}
-        
-        .modal-body {{
-            padding: 1.5rem;
-        }}
-        
-        .section-title {{
-            font-size: 1.125rem;
-            font-weight: 600;
-            color: #111827;
-            margin: 1.5rem 0 0.75rem 0;
-            display: flex;
-            align-items: center;
-            gap: 0.5rem;
-        }}
-        
-        .timeline-stat {{
-            background: #f9fafb;
-            border-radius: 12px;
-            padding: 1rem;
-            text-align: center;
-            border: 1px solid #e5e7eb;
         }}
         
         .stat-value {{
-            font-size: 1.5rem;
-            font-weight: bold;
             color: {detail.color};
         }}
-        
-        .stat-label {{
-            font-size: 0.75rem;
-            color: #6b7280;
-            margin-top: 0.25rem;
-        }}
-        
-        .impact-row {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            padding: 0.75rem;
-            background: #f9fafb;
-            border-radius: 8px;
-            margin: 0.5rem 0;
-        }}
-        
-        .lesson-item {{
-            background: #f0f9ff;
-            border-left: 4px solid #3b82f6;
-            padding: 1rem;
-            border-radius: 8px;
-            margin: 0.5rem 0;
-            font-size: 0.875rem;
-            line-height: 1.6;
-        }}
     </style>
     
     <div class="scenario-modal">
@@ -275,22 +205,20 @@ def show_scenario_modal(scenario_name: str, portfolio_symbols: List[str], portfo
     </div>
     """, unsafe_allow_html=True)
     
+    # Per-holding losses and severity colors computed for all holdings at once
+    impacts = np.array([portfolio_impacts.get(symbol, detail.sp500_decline) for symbol in portfolio_symbols], dtype=float)
+    weights_arr = np.asarray(portfolio_weights, dtype=float)
+    loss_pcts = np.abs(impacts) * 100
+    bar_colors = IMPACT_COLORS[np.searchsorted(IMPACT_THRESHOLDS, loss_pcts)]
+    
     # Sort by impact (worst first)
-    impact_items = [(symbol, portfolio_impacts.get(symbol, detail.sp500_decline), weight) 
-                    for symbol, weight in zip(portfolio_symbols, portfolio_weights)]
-    impact_items.sort(key=lambda x: x[1])
+    order = np.argsort(impacts, kind="stable")
     
-    for symbol, impact, weight in impact_items:
-        loss_pct = abs(impact * 100)
-        weighted_loss = loss_pct * weight
-        
-        # Color based on severity
-        if loss_pct > 40:
-            bar_color = "#ef4444"
-        elif loss_pct > 25:
-            bar_color = "#f97316"
-        else:
-            bar_color = "#fbbf24"
+    for i in order:
+        symbol = portfolio_symbols[i]
+        weight = weights_arr[i]
+        loss_pct = loss_pcts[i]
+        bar_color = bar_colors[i]
         
         st.markdown(f"""
         <div class="impact-row">
@@ -312,8 +240,7 @@ def show_scenario_modal(scenario_name: str, portfolio_symbols: List[str], portfo
         """, unsafe_allow_html=True)
     
     # Total portfolio impact
-    total_loss = sum(abs(portfolio_impacts.get(s, detail.sp500_decline)) * w 
-                     for s, w in zip(portfolio_symbols, portfolio_weights))
+    total_loss = float(np.abs(impacts) @ weights_arr)
     
     st.markdown(f"""
     <div style="background: {detail.color}22; border: 2px solid {detail.color}; border-radius: 12px; 
@@ -0,0 +1,28 @@
+# utils/styles.py
+"""
+Static stylesheet loading
+Page CSS lives in assets/ and is read from disk once per process
+"""
+
+import streamlit as st
+from pathlib import Path
+
+ASSETS_DIR = Path(__file__).parent.parent / "assets"
+
+@st.cache_resource(show_spinner=False)
+def load_css(filename: str) -> str:
+    """
+    Read a stylesheet from assets/ and wrap it in a <style> tag
+    
+    Args:
+        filename: CSS file name inside the assets/ directory
+    
+    Returns:
+        Ready-to-emit <style> block (cached for the process lifetime)
+    """
+    css = (ASSETS_DIR / filename).read_text(encoding="utf-8")
+    return f"<style>\n{css}</style>"
+
+def inject_css(filename: str):
+    """Emit a cached stylesheet into the current page"""
+    st.markdown(load_css(filename), unsafe_allow_html=True)